@@ -2,6 +2,7 @@ import mimetypes
 
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Callable, Generic, Optional, TypeVar
 
@@ -10,32 +11,55 @@ from .protocols import APIResponse
 
 T = TypeVar("T")
 
+# load the mimetypes database at import so the first upload doesn't pay for parsing the system 'mime.types' files;
+# only when it isn't loaded yet, 'mimetypes.init()' rebuilds the database and drops types the application has added
+if not mimetypes.inited:
+    mimetypes.init()
 
-@dataclass(slots=True)
+# 'guess_file_type' is Python 3.13+, fall back to 'guess_type' for older versions
+_guess_mime_type = getattr(mimetypes, "guess_file_type", mimetypes.guess_type)
+
+# resolved mimetypes per (lowercase) suffix string; bounded by the known types as unknown suffixes aren't cached
+_mime_type_cache: dict[str, str] = {}
+
+
+def _mime_type_from_suffixes(suffixes: str) -> str:
+    """Determine the mimetype from a (lowercase) file suffix string, for example '.pdf' or '.tar.gz'. Cached as most
+    uploads share a small number of file extensions. Unknown suffixes aren't cached, so types registered later with
+    'mimetypes.add_type()' are found; changing the type of a suffix that has already been resolved has no effect.
+    :param suffixes: file suffix string"""
+    mime_type = _mime_type_cache.get(suffixes)
+
+    if mime_type is None:
+        mime_type, _ = _guess_mime_type(f"file{suffixes}")
+
+        if mime_type is None:
+            return "application/octet-stream"
+
+        _mime_type_cache[suffixes] = mime_type
+
+    return mime_type
+
+
+@dataclass
 class FileUpload:
     file: Path
 
     def __post_init__(self):
         self.file = Path(self.file)  # enforce type
 
-    @property
+    @cached_property
     def mime_type(self) -> str:
         """Determine file mimetype"""
-        try:
-            mime_type, _ = mimetypes.guess_file_type(self.file)  # Python 3.13+
-        except AttributeError:
-            mime_type, _ = mimetypes.guess_type(self.file)
-
-        if mime_type:
-            return mime_type
-
-        return "application/octet-stream"
+        # only the last two suffixes are relevant to the lookup (covers encodings such as '.tar.gz')
+        return _mime_type_from_suffixes("".join(self.file.suffixes[-2:]).lower())
 
     def as_dict(self) -> dict:
-        """Convert self to dictionary represenation. Used for file uploads."""
+        """Convert self to dictionary represenation. Used for file uploads. The file path is not opened here, the
+        file is opened (and closed) by the session when the upload request is made."""
         return {
             "file_name": (None, self.file.name),
-            "file_content": (self.file.name, self.file.open("rb"), self.mime_type),
+            "file_content": (self.file.name, self.file, self.mime_type),
         }
 
 
@@ -54,52 +78,84 @@ class Page(Generic[T]):
 
 
 class PaginatedResult(Generic[T]):
-    """Wraps paginated results allowing iteration over pages or access to flattened results."""
+    """Wraps paginated results allowing iteration over pages or access to flattened results. Pages are only fetched
+    when they are first consumed and each page is fetched at most once (until the cache is refreshed)."""
 
     def __init__(self, pager: Callable[[], Iterator[Page[T]]]) -> None:
         self._pager_func = pager
-        self._data_cache: Optional[list[T]] = None
-        self._pages_cache: Optional[list[Page[T]]] = None
+        self._pager: Optional[Iterator[Page[T]]] = None
+        self._pager_exhausted: bool = False
+        self._pages_cache: list[Page[T]] = []
 
     def __repr__(self) -> str:
+        # only report cached state; accessing 'pages'/'data' here would fetch every page
         cls = type(self).__name__
-        properties = []
+        state = "exhausted" if self._pager_exhausted else "pending"
+        cached_records = len(self._data_list) if "_data_list" in self.__dict__ else "unloaded"
 
-        for name, attr in type(self).__dict__.items():
-            if isinstance(attr, property) and not name.startswith("_"):
-                try:
-                    value = getattr(self, name)
-                except Exception as e:
-                    value = f"<error: {e}"
-
-                properties.append(f"{name}={value!r}")
-
-        return f"{cls}({', '.join(properties)})"
+        return f"{cls}(cached_pages={len(self._pages_cache)}, pager={state}, cached_records={cached_records})"
 
     @property
     def pages(self) -> Iterator[Page[T]]:
-        """Yield 'Page' objects."""
-        if self._pages_cache is None:
-            self._pages_cache = list(self._pager_func())
+        """Yield 'Page' objects. Already fetched pages are yielded from cache, remaining pages are fetched on demand;
+        multiple consumers share the same fetched pages."""
+        idx = 0
+
+        while True:
+            if idx < len(self._pages_cache):
+                yield self._pages_cache[idx]
+                idx += 1
+                continue
+
+            if self._pager_exhausted:
+                return
 
-        return iter(self._pages_cache)
+            if self._pager is None:
+                self._pager = self._pager_func()
+
+            try:
+                page = next(self._pager)
+            except StopIteration:
+                self._pager_exhausted = True
+                return
+
+            self._pages_cache.append(page)
 
     @property
     def results(self) -> Iterator[T]:
-        """Yields individual records across all pages."""
+        """Yields individual records across all pages. Data is cached once all pages have been consumed."""
+        if "_data_list" in self.__dict__:
+            yield from self._data_list
+            return
+
+        data = []
+
         for page in self.pages:
-            yield from page.data
+            page_data = page.data
+            data.extend(page_data)
+            yield from page_data
+
+        self.__dict__["_data_list"] = data  # populate the 'self._data_list' cache
 
     @property
     def data(self) -> Sequence[T]:
         """Return all data from pages as a single sequence object (list)."""
-        # use cache or create cache to ensure items are not rebuilt on every access
-        if self._data_cache is None:
-            self._data_cache = list(self.results)
+        return self._data_list
 
-        return self._data_cache
+    @cached_property
+    def _data_list(self) -> list[T]:
+        """Cache of all data from pages; ensures items are not rebuilt on every access."""
+        return list(self.iter_results())
+
+    def iter_results(self) -> Iterator[T]:
+        """Yields individual records across all pages without building the flattened data cache. Only the pages
+        required to satisfy the consumer are fetched."""
+        for page in self.pages:
+            yield from page.data
 
     def refresh_cache(self) -> None:
         """Refresh internal data and page cache."""
-        self._data_cache = None
-        self._pages_cache = None
+        self._pager = None
+        self._pager_exhausted = False
+        self._pages_cache = []
+        self.__dict__.pop("_data_list", None)
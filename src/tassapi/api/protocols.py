@@ -19,6 +19,7 @@ class TassAPIServer(Protocol):
     token_expire_offset: Optional[int]
     retries: Optional[int]
     status_forcelist: Optional[Sequence[int]]
+    pool_maxsize: Optional[int]
 
     @property
     def retry_adapter(self) -> Retry:
@@ -82,6 +83,10 @@ class APISession(Protocol):
         """Authenticate to the API."""
         ...
 
+    def ensure_authenticated(self, *, auth_endpoint: str = "users") -> None:
+        """Authenticate to the API when not authenticated or the token has expired; thread safe."""
+        ...
+
     def parse_request_kwargs(self, **kwargs) -> tuple[dict, dict]:
         """Parse kwargs that are specific to requests. Returns a tuple of request related kwargs and function
         related kwargs."""
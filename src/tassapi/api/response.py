@@ -1,12 +1,15 @@
+import re
+
 from collections.abc import Sequence
 from functools import cached_property
 from typing import Any, Optional
-from urllib.parse import parse_qs, urlparse
 
 import requests
 
+from requests.utils import guess_json_utf
+
 from ..utils.datetime_utils import datetime_obj_hook
-from ..utils.json_utils import parse_json_with_hooks
+from ..utils.json_utils import json_loads, parse_json_with_hooks
 from ..utils.request_utils import (
     parse_has_file_stream,
     parse_digest_data_from_response,
@@ -14,7 +17,34 @@ from ..utils.request_utils import (
     parse_response_error_data,
 )
 
-DEFAULT_SAFE_HTTP_OK = set(range(200, 400))
+DEFAULT_SAFE_HTTP_OK = frozenset(range(200, 400))
+
+# every datetime format candidate starts with a 4 digit year, so a JSON string value starting with 'YYYY-' must be
+# present for the datetime hook to convert anything
+date_like_json_ptn = re.compile(rb'"\d{4}-')
+
+# declared encodings that can be decoded directly from the response bytes
+UTF8_ENCODING_NAMES = frozenset(("utf-8", "utf8"))
+
+# requests percent encodes the '$' in OData param names when encoding params into the url
+TOP_PARAM_KEYS = ("&%24top=", "&$top=")
+
+
+def _extract_top(url: str) -> int:
+    """Return the value of the OData '$top' param in a url, or -1 when the param isn't present. Scans the query string
+    directly rather than parsing every param, as this runs once per page when paginating.
+    :param url: url string"""
+    query = "&" + url.partition("?")[2]
+
+    for key in TOP_PARAM_KEYS:
+        start = query.find(key)
+
+        if start >= 0:
+            start += len(key)
+            end = query.find("&", start)
+            return int(query[start:end] if end >= 0 else query[start:])
+
+    return -1
 
 
 class APIResponse:
@@ -42,52 +72,79 @@ class APIResponse:
 
     def __init__(self, r: requests.Response, *, safe_statuses: Optional[Sequence[int]] = None) -> None:
         self.r = r
-        self.safe_statuses = DEFAULT_SAFE_HTTP_OK.union(set(safe_statuses or []))
+        self._extra_safe_statuses = frozenset(safe_statuses) if safe_statuses else frozenset()
         self._json_cache: Any = None
         self._json_cached: bool = False
 
+        # forward the frequently used 'requests.Response' attributes directly so they don't go through '__getattr__'
+        self.status_code: int = r.status_code
+        self.headers = r.headers
+        self.url: str = r.url
+        self.reason: str | bytes = r.reason
+
     def __getattr__(self, name: str) -> Any:
-        """Custom getattr implementation to return attributes from requests.Response as well as our own."""
-        try:
-            return object.__getattribute__(self, name)
-        except AttributeError:
-            return getattr(self.r, name)
+        """Custom getattr implementation to return attributes from requests.Response as well as our own. Only called
+        when normal attribute lookup fails."""
+        if name == "r":  # 'self.r' not set yet (for example during unpickling), avoid infinite recursion
+            raise AttributeError(name)
+
+        return getattr(self.r, name)
 
     def __repr__(self) -> str:
         return f"<APIResponse [{self.status_code}]>"
 
+    def copy(self) -> "APIResponse":
+        """Return a new wrapper around the same 'requests.Response'. The new wrapper decodes its own 'data', so changes
+        made to one wrapper's data are not seen through the other."""
+        return type(self)(self.r, safe_statuses=self._extra_safe_statuses)
+
     @cached_property
+    def safe_statuses(self) -> frozenset[int]:
+        """All status codes considered 'safe'; HTTP 200-399 and any 'safe_statuses' passed to the request."""
+        return DEFAULT_SAFE_HTTP_OK.union(self._extra_safe_statuses)
+
+    @property
     def data(self) -> Optional[Sequence[dict[str, Any]]]:
-        """Convenience property that calls 'self.json()' for pagination."""
+        """Convenience property that decodes the response JSON for pagination; the result is cached after the first
+        access."""
+        if self._json_cached:
+            return self._json_cache
+
         if not self.has_json:
-            return []
+            data = []
+        else:
+            # skip the datetime hook entirely for payloads without any date like strings (for example option lookups);
+            # the byte pattern only applies to plain UTF-8 content
+            has_dates = not self._is_plain_utf8 or date_like_json_ptn.search(self.r.content)
+            hooks = (datetime_obj_hook, ) if has_dates else None
+            data = parse_json_with_hooks(self._decode_json(), hooks=hooks)
 
-        data = parse_json_with_hooks(self.r.json(), hooks=(datetime_obj_hook, ))
+        self._json_cache, self._json_cached = data, True
 
         return data
 
-    @property
+    @cached_property
     def digest_data(self) -> tuple[Optional[str], Optional[str]]:
         """Where available, return the digest type (for example; 'sha-256') and value. This relates only to remote
         file resources that can be downloaded or uploaded."""
         return parse_digest_data_from_response(self.r)
 
-    @property
+    @cached_property
     def filename(self) -> Optional[str]:
         """Where available, return the filename of the remote resource as indicated by the 'content-disposition'
         header data."""
         return parse_filename_from_response(self.r)
 
-    @property
+    @cached_property
     def has_file_stream(self) -> bool:
         """Response has a file-stream as indicated by either 'attachment' or 'inline' value in the
         'content-disposition' header value."""
         return parse_has_file_stream(self.r)
 
-    @property
+    @cached_property
     def has_json(self) -> bool:
         """Indicates the response has JSON; determined by the 'Content-Type' header including 'application/json' in the
-        value."""
+        value. Cached, the response headers don't change once received."""
         return "application/json" in self.headers.get("content-type", "").casefold()
 
     @property
@@ -102,12 +159,39 @@ class APIResponse:
         r = getattr(self, "r", None)
         return r is not None and isinstance(r, requests.Response)
 
-    @property
+    @cached_property
     def resp_ok(self) -> bool:
         """Check if the response is 'ok' by checking the response status code against a safe list of status codes.
         By default any HTTP status code between HTTP 200-399 is considered OK.
         This differs to 'requests.Response.status_ok'."""
-        return self.r.status_code in self.safe_statuses
+        code = self.status_code
+
+        # range test covers the default safe statuses without building the full set of safe statuses
+        return 200 <= code < 400 or code in self._extra_safe_statuses
+
+    @cached_property
+    def _is_plain_utf8(self) -> bool:
+        """The response content is UTF-8 JSON without a BOM (the declared encoding is absent or UTF-8), so it can be
+        decoded directly from bytes; anything else is left to 'requests' to decode."""
+        encoding = self.r.encoding
+
+        if encoding is not None and encoding.casefold() not in UTF8_ENCODING_NAMES:
+            return False
+
+        return guess_json_utf(self.r.content) == "utf-8"
+
+    def _decode_json(self) -> Any:
+        """Decode the response JSON; plain UTF-8 content is decoded with 'orjson' when it is installed, otherwise
+        'requests.Response.json()' is used. Decode failures raise 'requests.exceptions.JSONDecodeError' either way."""
+        if not self._is_plain_utf8:
+            return self.r.json()
+
+        try:
+            return json_loads(self.r.content)
+        except ValueError:  # 'json.JSONDecodeError', 'orjson.JSONDecodeError' and 'UnicodeDecodeError'
+            # content that isn't valid JSON (or isn't valid UTF-8) is decoded again by 'requests', which decodes
+            # invalid UTF-8 leniently and raises its own 'JSONDecodeError' for invalid JSON, as it did before
+            return self.r.json()
 
     def _has_more(self, expected: Optional[int] = None) -> bool:
         """Check if the JSON object in the response may have more data to return when querying a paginated endpoint
@@ -117,50 +201,45 @@ class APIResponse:
         if not self.has_json:
             return False
 
-        params = parse_qs(urlparse(self.r.url).query)
+        # actual number of records; relies on the response JSON already being an array, uses the cached 'self.data'
+        # so the response body is only decoded once
+        page_len = len(self.data)
 
-        page_len = len(self.json())  # actual number of records; relies on the response JSON already being an array
-        expected = expected or int(params["$top"][0])
+        if not expected:
+            expected = _extract_top(self.url)
 
         return page_len == expected
 
     def json(self, **kwargs) -> Optional[dict[str, Any]]:
         """Access raw JSON from the requests response; no hooks or other processing applied unless specified in
-        kwargs."""
-        return self.r.json(**kwargs)
+        kwargs. Without kwargs plain UTF-8 content is decoded with 'orjson' when it is installed."""
+        if kwargs:
+            return self.r.json(**kwargs)
+
+        return self._decode_json()
 
     def raise_for_status(self) -> None:
         """Customise the 'requests.Response.raise_for_status()' to also include any additional error message data from
         the API response, and only raise exceptions when the status code is not considered a 'safe' status code.
         :param r: response object"""
-        if not self.resp_ok:
-            http_error_msg, err_type = "", None
-
-            if isinstance(self.r.reason, bytes):
-                # We attempt to decode utf-8 first because some servers
-                # choose to localize their reason strings. If the string
-                # isn't utf-8, we fall back to iso-8859-1 for all other
-                # encodings. (See PR #3538)
-                try:
-                    reason = self.r.reason.decode("utf-8")
-                except UnicodeDecodeError:
-                    reason = self.r.reason.decode("iso-8859-1")
-            else:
-                reason = self.r.reason
-
-            if 400 <= self.r.status_code < 500:
-                err_type = "Client Error"
-            elif 500 <= self.r.status_code < 600:
-                err_type = "Server Error"
-
-            if err_type is not None:
-                http_error_msg = f"{self.r.status_code} {err_type}: {reason} for url: {self.r.url}"
-
-            if http_error_msg:
-                api_err_data = parse_response_error_data(self.r) if self.has_raw_resp else None
-
-                if api_err_data is not None:
-                    suffix = "API error data:\n{title} {detail}\n{errors}\n{message}".format(**api_err_data)
-                    http_error_msg = f"{http_error_msg}\n{suffix}"
-
-                raise requests.exceptions.HTTPError(http_error_msg)
+        if self.resp_ok:
+            return
+
+        code = self.status_code
+
+        # only client/server error status codes raise; nothing else needs the reason decoded
+        if not 400 <= code < 600:
+            return
+
+        err_type = "Client Error" if code < 500 else "Server Error"
+        reason = self.reason.decode("utf-8", "replace") if isinstance(self.reason, bytes) else self.reason
+        http_error_msg = f"{code} {err_type}: {reason} for url: {self.url}"
+        r = self.r if self.has_raw_resp else None
+        api_err_data = parse_response_error_data(r) if r is not None else None
+
+        if api_err_data is not None:
+            suffix = "API error data:\n{title} {detail}\n{errors}\n{message}".format(**api_err_data)
+            http_error_msg = f"{http_error_msg}\n{suffix}"
+
+        # attach the response so callers can inspect it from the exception, as 'requests' does
+        raise requests.exceptions.HTTPError(http_error_msg, response=r)
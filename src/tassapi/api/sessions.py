@@ -1,29 +1,59 @@
 import inspect
 import logging
+import threading
+import time
 
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, ContextManager, Optional
+from typing import Any, BinaryIO, ContextManager, Optional
 from urllib.parse import urlparse
 
 import requests
 
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter, Retry
 from ..utils.request_utils import build_user_agent, urljoin
 
 log = logging.getLogger(__name__)
 
 
-REQUEST_PARAM_NAMES = tuple(
+REQUEST_PARAM_NAMES = frozenset(
     name for name in inspect.signature(requests.Session.request).parameters if not name == "self"
 )
+DEFAULT_PORTS = {"http": 80, "https": 443}
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+CONTENT_TYPE_BY_METHOD = {
+    "patch": "application/json-patch+json",
+    "post": "application/json",
+    "put": "application/json",
+}
 
 
-@dataclass
-class TassAPIServer:
+@lru_cache(maxsize=512)
+def _parse_origin(url: str) -> tuple[str, str, Optional[int]]:
+    """Parses the url into scheme, hostname, and port for comparison. Cached as redirect chains tend to repeat the
+    same hosts.
+    :param url: url to parse"""
+    p = urlparse(url)
+    scheme = p.scheme.lower()
+    hostname = p.hostname.lower() if p.hostname else ""
+    port = p.port if p.port is not None else DEFAULT_PORTS.get(scheme)
+
+    return (scheme, hostname, port)
+
+
+class _RetrySlots:
+    """Holds the slot for the 'Retry' instance built by 'TassAPIServer'; a base class keeps it out of the dataclass
+    fields (so it isn't part of 'dataclasses.fields()'/'asdict()') while still using slots."""
+
+    __slots__ = ("_retry_adapter",)
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class TassAPIServer(_RetrySlots):
     """Server Configuration.
     :param base: base url, for example 'https://tass.example.org/api'
     :param key: client key (refer to the TASS API documentation on how this is generated)
@@ -36,7 +66,9 @@ class TassAPIServer:
     :param retries: the maximum number of retries when a rate limit HTTP status is sent (HTTP 429); default is 5
     :param status_forcelist: a list of HTTP status codes (integers) where retries can be made; this should only
                              include HTTP status codes that are idempotent; default is '[429]' (this is mutated
-                             to a set in post init)"""
+                             to a frozenset in post init)
+    :param pool_maxsize: the maximum number of connections kept alive in the connection pool that is shared by all
+                         endpoints using the session; default is 16"""
 
     base: str
     key: str
@@ -47,19 +79,29 @@ class TassAPIServer:
     token_expire_offset: Optional[int] = field(default=60)
     retries: Optional[int] = field(default=5)
     status_forcelist: Optional[Sequence[int]] = field(default_factory=lambda: [429])
+    pool_maxsize: Optional[int] = field(default=16)
 
     def __post_init__(self):
         # always ensure HTTP 429 (signals rate limit) is covered in retry
-        self.status_forcelist = set(self.status_forcelist)
-        self.status_forcelist.add(429)
+        self.status_forcelist = frozenset((*self.status_forcelist, 429))
+        self._retry_adapter = Retry(total=self.retries, status_forcelist=self.status_forcelist)
+
+    def __repr__(self) -> str:
+        # 'key' and 'secret' are intentionally omitted
+        return (
+            f"{type(self).__name__}(base={self.base!r}, cmpy_code={self.cmpy_code!r}, "
+            f"attachment_dest={self.attachment_dest!r}, token_expire_offset={self.token_expire_offset!r}, "
+            f"retries={self.retries!r}, status_forcelist={self.status_forcelist!r}, pool_maxsize={self.pool_maxsize!r})"
+        )
 
     @property
     def retry_adapter(self) -> Retry:
-        """Return a new instance of requests.adapters.Retry with retry settings applied."""
-        return Retry(total=self.retries, status_forcelist=self.status_forcelist)
+        """Return an instance of requests.adapters.Retry with retry settings applied, built once at init; changing
+        'retries' or 'status_forcelist' afterwards has no effect on it."""
+        return self._retry_adapter
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class APITokenData:
     """Dataclass to hold token data from authentication response."""
 
@@ -77,8 +119,8 @@ class APITokenData:
             return v
 
         if isinstance(v, str):
-            # normalize to datetime, normalize UTC first
-            return datetime.fromisoformat(v.replace("Z", "+00:00"))
+            # 'fromisoformat' parses a 'Z' (UTC) suffix natively as of Python 3.11
+            return datetime.fromisoformat(v)
 
 
 class PreserveAuthenticationAdapter(HTTPAdapter):
@@ -89,44 +131,35 @@ class PreserveAuthenticationAdapter(HTTPAdapter):
     redirects when the server omits it, and cleans up the temporary attributes on the final (non-redirect)
     response."""
 
-    def _parse_origin(self, url: str) -> tuple[str, str, Optional[int]]:
-        """Parses the url into scheme, hostname, and port for comparison"""
-        p = urlparse(url)
-        scheme = p.scheme.lower()
-        hostname = p.hostname.lower() if p.hostname else ""
-        port = p.port if p.port is not None else (80 if scheme == "http" else 443 if scheme == "https" else None)
-
-        return (scheme, hostname, port)
-
-    def _is_same_origin(self, url_1: str, url_2: str) -> bool:
-        """Returns True/False if url_1 and url_2 have the same scheme, hostname, port, etc.
-        :param url_1: first url to compare
-        :param url_2: second url to compare"""
-        url1 = self._parse_origin(url_1)
-        url2 = self._parse_origin(url_2)
-
-        return url1 == url2
+    def _is_same_origin(self, url: str, origin: tuple[str, str, Optional[int]]) -> bool:
+        """Returns True/False if url has the same scheme, hostname, port, etc as an already parsed origin.
+        :param url: url to compare
+        :param origin: parsed origin tuple to compare against"""
+        return _parse_origin(url) == origin
 
     def send(self, request, **kwargs):
-        # on the first request, store the original url and auth in request attributes for thread safety
-        if not hasattr(request, "_original_request_url"):
-            request._original_request_url = request.url
-            request._original_auth = request.headers.get("Authorization")
+        # use the instance dict directly, avoids the exception driven 'hasattr'/'delattr' probes on every hop
+        attrs = request.__dict__
+
+        # on the first request, store the original url, origin, and auth in request attributes for thread safety
+        if "_original_request_url" not in attrs:
+            attrs["_original_request_url"] = request.url
+            attrs["_original_origin"] = _parse_origin(request.url)
+            attrs["_original_auth"] = request.headers.get("Authorization")
 
         # on redirect requests, restore the auth if the authorization header is missing
-        if request.url != getattr(request, "_original_request_url"):
+        if request.url != attrs["_original_request_url"]:
             # check origin before applying auth header
-            if request._original_auth and "Authorization" not in request.headers:
-                if self._is_same_origin(request._original_request_url, request.url):
-                    request.headers["Authorization"] = request._original_auth
+            if attrs["_original_auth"] and "Authorization" not in request.headers:
+                if self._is_same_origin(request.url, attrs["_original_origin"]):
+                    request.headers["Authorization"] = attrs["_original_auth"]
 
         response = super().send(request, **kwargs)
 
-        # reset original url and auth after final response
+        # reset original url, origin, and auth after final response
         if not response.is_redirect:
-            for attr in ["_original_request_url", "_original_auth"]:
-                if hasattr(request, attr):
-                    delattr(request, attr)
+            for attr in ("_original_request_url", "_original_origin", "_original_auth"):
+                attrs.pop(attr, None)
 
         return response
 
@@ -151,10 +184,18 @@ class APISession(requests.Session):
     def __init__(self, server: TassAPIServer) -> None:
         super().__init__()
         self._metadata: dict[str, Any] = {}
+        self._auth_lock = threading.RLock()  # the session is shared by worker threads making concurrent requests
 
         self.server = server
         self.headers.update(self._default_headers)
-        self.mount("https://", PreserveAuthenticationAdapter(max_retries=self.server.retry_adapter))
+
+        # one adapter (and so one keep-alive connection pool) is shared by every endpoint using this session
+        adapter = PreserveAuthenticationAdapter(
+            pool_maxsize=self.server.pool_maxsize or DEFAULT_POOLSIZE,
+            max_retries=self.server.retry_adapter,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
 
     @property
     def allowed_companies(self) -> Optional[list[dict[str, str]]]:
@@ -167,7 +208,8 @@ class APISession(requests.Session):
     @property
     def authenticated(self) -> bool:
         """Session is authenticated."""
-        return self.has_token and not self.token_expired
+        # inlined 'has_token' and 'token_expired'; this is checked on every request
+        return "Authorization" in self.headers and time.time() < self._metadata.get("expires_at", 0.0)
 
     @property
     def auth_data(self) -> Optional[APITokenData]:
@@ -184,59 +226,71 @@ class APISession(requests.Session):
     @property
     def token_expired(self) -> bool:
         """A token has expired."""
-        # no auth data implies not authenticated, so technically token has expired
-        if self.auth_data is None:
-            return True
-
-        adjusted_expire_time = self.auth_data.token_expiry_date - timedelta(seconds=self.server.token_expire_offset)
-
-        # when the adjusted expire time IS less than datetime.now(), this must be False in order to not be expired
-        expired = not adjusted_expire_time <= datetime.now()
-
-        return expired
+        # no auth data implies not authenticated, so no expiry timestamp exists and the token has technically expired
+        return time.time() >= self._metadata.get("expires_at", 0.0)
 
     @property
     def valid_company_code(self) -> bool:
         """Once authenticated, validate the company code from the server instance is one that the API
         returns."""
-        if self.allowed_companies:
-            for cmpy in self.allowed_companies:
-                return self.server.cmpy_code in cmpy.get("cmpy_code", "")
-
-        return False
+        return self.server.cmpy_code in self._metadata.get("cmpy_codes", frozenset())
 
     def authenticate(self, *, auth_endpoint: str = "users") -> None:
-        """Performs initial authentication.
+        """Performs initial authentication. Only one thread authenticates at a time.
         :param auth_endpoint: string value of endpoint used for authentication; default is 'users'"""
         url = urljoin(self.server.base, auth_endpoint)
         payload = self._auth_payload()
-        response = requests.post(url, headers=self.headers, json=payload)
 
-        try:
-            auth_data = self._make_token(response.json())
-        except Exception:
-            raise APIAuthenticationException(response)
+        with self._auth_lock:
+            response = self.post(url, json=payload)  # session headers, retries, and pooled connection are applied
+
+            try:
+                auth_data = self._make_token(response.json())
+            except Exception:
+                raise APIAuthenticationException(response)
+
+            if auth_data is not None:
+                auth_headers = {"Authorization": f"Bearer {auth_data.token}"}
+                self.headers.update(auth_headers)
+                self._metadata["auth_data"] = auth_data
+                # POSIX timestamp of the expiry (adjusted by the offset) so expiry checks are a single float compare
+                self._metadata["expires_at"] = (
+                    auth_data.token_expiry_date.timestamp() - (self.server.token_expire_offset or 0)
+                )
+                self._metadata["cmpy_codes"] = frozenset(
+                    cmpy.get("cmpy_code", "") for cmpy in auth_data.allowed_companies or []
+                )
+
+    def ensure_authenticated(self, *, auth_endpoint: str = "users") -> None:
+        """Authenticate when the session is not authenticated or the token has expired. Safe to call from worker
+        threads sharing the session: when several threads find the token expired at the same time only one of them
+        authenticates, the others wait and then use the new token.
+        :param auth_endpoint: string value of endpoint used for authentication; default is 'users'"""
+        if self.authenticated:
+            return
 
-        if auth_data is not None:
-            auth_headers = {"Authorization": f"Bearer {auth_data.token}"}
-            self.headers.update(auth_headers)
-            self._metadata["auth_data"] = auth_data
+        with self._auth_lock:
+            if not self.authenticated:  # another thread may have authenticated while this one waited for the lock
+                self.authenticate(auth_endpoint=auth_endpoint)
 
     def parse_request_kwargs(self, **kwargs) -> tuple[dict, dict]:
         """Separate kwargs for the requests.Session.request call from other kwargs used elsewhere."""
         req_kwargs = {}
         func_kwargs = {}
 
+        # local bindings; this runs for every request
+        param_names = REQUEST_PARAM_NAMES
+        set_req, set_func = req_kwargs.__setitem__, func_kwargs.__setitem__
+
         for key, value in kwargs.items():
-            if key in REQUEST_PARAM_NAMES:
-                req_kwargs[key] = value
-            else:
-                func_kwargs[key] = value
+            (set_req if key in param_names else set_func)(key, value)
 
         return (req_kwargs, func_kwargs)
 
     def prepare_file_upload(self, files: dict[str, Any]) -> ContextManager[dict[str, tuple]]:
-        """Create a context manager for handling file uploads.
+        """Create a context manager for handling file uploads. Any 'Path' objects in the file object position of a
+        files tuple are opened when the context is entered and closed when the context is closed; file objects that
+        are passed in already opened are left for the caller to close.
         :param files: files dictionary, must conform to the POST Multiple Multipart-Encoded FIles documented here:
             https://docs.python-requests.org/en/latest/user/advanced/#advanced"""
         if not isinstance(files, dict):
@@ -244,33 +298,45 @@ class APISession(requests.Session):
 
         @contextmanager
         def upload_context() -> Iterator[dict[str, tuple]]:
-            """Actions to perform when the context is closed."""
+            """Yield the files for the request, files opened here are closed when the context is closed."""
             try:
                 files_dict = dict(files)
             except Exception as e:
                 raise ValueError(f"failed to prepare file upload: {e}") from e
+
+            opened: list[BinaryIO] = []
+
+            try:
+                for name, item in files_dict.items():
+                    # item is a tuple like (filename, file_obj, mime_type); open file paths here so the file handle
+                    # lifetime is tied to the request
+                    if isinstance(item, tuple) and len(item) > 1 and isinstance(item[1], Path):
+                        fh = item[1].open("rb", buffering=UPLOAD_BUFFER_SIZE)
+                        opened.append(fh)
+                        files_dict[name] = (item[0], fh, *item[2:])
+
+                yield files_dict
             finally:
-                # close file like objects
-                for item in files_dict.values():
-                    # item is a tuple like (filename, file_obj, mime_type)
-                    if len(item) > 1 and hasattr(item[1], "close"):
-                        item[1].close()
+                for fh in opened:
+                    fh.close()
 
         return upload_context()
 
     def set_content_type_header(self, method: str, *, req_kw: dict[str, Any]) -> None:
         """Set the value for 'Content-Type' header based on HTTP method and payload.
-        :param method: HTTP method performed, for example 'PATCH'
+        :param method: lowercase HTTP method performed, for example 'patch'
         :param req_kw: request keyword arguments"""
         headers = req_kw.setdefault("headers", {})  # current headers from the request or empty dict
 
         if "files" in req_kw:
             # pop 'Content-Type' out so that requests directly sets correct value for multipart/form-data uploads
             headers.pop("Content-Type", None)
-        elif method == "patch":
-            headers["Content-Type"] = "application/json-patch+json"
-        elif method in ("post", "put"):
-            headers["Content-Type"] = "application/json"
+            return
+
+        content_type = CONTENT_TYPE_BY_METHOD.get(method)
+
+        if content_type is not None:
+            headers["Content-Type"] = content_type
         else:
             headers.setdefault("Content-Type", "application/json")
 
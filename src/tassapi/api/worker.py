@@ -1,7 +1,11 @@
 import logging
+import os
+import tempfile
 
-from collections.abc import Callable, Iterator
-from functools import wraps
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Optional, TypeVar
 
@@ -9,14 +13,42 @@ import requests
 
 from .protocols import APISession
 from .response import APIResponse
+from .sessions import REQUEST_PARAM_NAMES
 from .models import FileUpload, Page, PaginatedResult
-from ..utils.request_utils import urljoin
+from ..utils.request_utils import stream_to_file_with_digest, urljoin
 from ..utils.typehints import PayloadObject
-from ..utils.validation_utils import raise_for_digest_error, raise_for_reqd_attrs
+from ..utils.validation_utils import raise_for_digest_mismatch, raise_for_reqd_attrs
 
 log = logging.getLogger(__name__)
 
 T = TypeVar("T")
+R = TypeVar("R")
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def endpoint_url(base: str, cmpy_code: str, endpoint: Optional[str]) -> str:
+    """Return the url for an endpoint, cached; these components are constant for the life of an endpoint instance.
+    :param base: base url, for example 'https://tass.example.org/api'
+    :param cmpy_code: company code
+    :param endpoint: endpoint path, for example 'students'"""
+    return urljoin(base, cmpy_code, endpoint)
+
+
+def _reserve_unique_path(fp: Path) -> Path:
+    """Create an empty file at 'fp', or at the first free 'name (n).ext' variant when 'fp' already exists, and return
+    its path. Creation is exclusive ('xb'), so concurrent callers never reserve the same path.
+    :param fp: file path"""
+    candidate, n = fp, 0
+
+    while True:
+        try:
+            with open(candidate, "xb"):
+                return candidate
+        except FileExistsError:
+            n += 1
+            candidate = fp.with_name(f"{fp.stem} ({n}){fp.suffix}")
 
 
 def request(method: str) -> Callable:
@@ -26,16 +58,23 @@ def request(method: str) -> Callable:
 
     def wrapper(fn: Callable) -> Callable:
         @wraps(fn)
-        def wrapped_fn(self, *args, **kwargs) -> APIResponse:
-            if not self.session.authenticated:
-                self.session.authenticate()
+        def wrapped_fn(self, *args, safe_statuses: Optional[Iterable[int]] = None, **kwargs) -> APIResponse:
+            self.session.ensure_authenticated()
+
+            server = self.session.server
+            url = endpoint_url(server.base, server.cmpy_code, self.endpoint)
+
+            if args:
+                url = urljoin(url, *args)
+
+            # 'kwargs' is already a new dict, only split it when it holds something other than requests params
+            if kwargs.keys() <= REQUEST_PARAM_NAMES:
+                req_kw = kwargs
+            else:
+                req_kw, _ = self.session.parse_request_kwargs(**kwargs)
 
-            path = urljoin(*args) if args else None
-            url = urljoin(self.session.server.base, self.session.server.cmpy_code, self.endpoint, path)
-            req_kw, fnc_kw = self.session.parse_request_kwargs(**kwargs)
             has_patch_obj = bool(req_kw.get("data", None))
             has_files = bool(req_kw.get("files"))
-            safe_statuses = fnc_kw.get("safe_statuses", None)
             self.session.set_content_type_header(method, req_kw=req_kw)
 
             # seems the TASS API only supports a JSON string, so converft
@@ -82,6 +121,9 @@ class TassWorker:
         - 'paginate' iterates endpoints that have paged responses; returns a 'PaginatedResult' instance where parsed
           data (to JSON) is accessible through .data; result data can be paginated through .results, and each page
           response object can be accessed through .pages
+        - 'paginate_concurrent' as 'paginate', but keeps several page requests in flight using a thread pool
+        - 'map_concurrent' calls a function for each item using a thread pool sharing the session, returning each
+          item's result or exception; used for batch uploads/downloads
 
     All HTTP methods will return an instance of APIResponse (this wraps the requests.Response object) or raise
     exceptions if the HTTP status code for the response is one indicative of an error.
@@ -90,6 +132,8 @@ class TassWorker:
     integers that are 'safe' to ignore when 'APIResponse.raise_for_status' is called. By default all HTTP 200-399
     statuses are considered safe."""
 
+    __slots__ = ("session",)
+
     def __init__(self, session: APISession) -> None:
         self.session = session
 
@@ -118,6 +162,7 @@ class TassWorker:
         out_fn: Optional[str] = None,
         chunk_size: Optional[int] = None,
         validate_checksum: Optional[bool] = True,
+        unique: Optional[bool] = False,
         **kwargs
     ) -> tuple[requests.Response, Optional[Path]]:
         """Download a file. A URL path must be presented in order for the download to occur. A value must also
@@ -126,27 +171,53 @@ class TassWorker:
         :param dest: override the session.server.attachment_dest attribute with an existing directory the file will be
                      downloaded into
         :param out_fn: optionally override the remote filename with a string filename value
-        :param chunk_size: an optional integer to use as the chunk size when iterating over the file object
+        :param chunk_size: an optional integer to use as the chunk size when iterating over the file object; default
+                           is 1 MiB
         :param validate_checksum: validate the checksum digest of the file against the checksum digest of the
-                                  downloaded file"""
+                                  downloaded file; the digest is computed as the file is written, a mismatch raises
+                                  a 'ValueError' and the downloaded file is removed
+        :param unique: never overwrite an existing file, a numbered suffix is added to the filename instead (for
+                       example 'scan (1).pdf'); the filename is reserved atomically, so concurrent downloads of files
+                       with the same name each write to their own file"""
+        kwargs.setdefault("stream", True)  # don't hold the whole file in memory before writing it out
         r = self._get(*args, safe_statuses=set(range(0, 999)), **kwargs)
 
         # handle circumstances where the response doesn't have a file stream because there is no remote file
         if not r.has_file_stream:
             log.error(f"no file stream detected for '{r.url}'")
+            _ = r.content  # read the (small) streamed body so the connection is released back to the pool
             return (r, None)
 
         dest = dest or self.session.server.attachment_dest
         out_fn = out_fn or r.filename
         fn = dest.joinpath(out_fn)
 
-        with fn.open("wb") as f:
-            for chunk in r.iter_content(chunk_size=chunk_size or 8192):
-                f.write(chunk)
+        if unique:
+            fn = _reserve_unique_path(fn)
 
-        if validate_checksum:
-            digest_type, digest_value = r.digest_data
-            raise_for_digest_error(fn, digest_type=digest_type, digest_value=digest_value)
+        digest_type, digest_value = r.digest_data if validate_checksum else (None, None)
+
+        # write to a temporary file next to the destination and only move it into place once it is complete (and the
+        # checksum validated), so a partial or corrupt download never sits at the destination path
+        fd, tmp = tempfile.mkstemp(dir=fn.parent, prefix=f".{fn.name}.", suffix=".part")
+        os.close(fd)
+        tmp = Path(tmp)
+
+        try:
+            actual_digest = stream_to_file_with_digest(
+                r, tmp, digest_type=digest_type, chunk_size=chunk_size or DOWNLOAD_CHUNK_SIZE
+            )
+
+            if actual_digest is not None:
+                raise_for_digest_mismatch(fn, actual_digest=actual_digest, digest_value=digest_value)
+
+            tmp.replace(fn)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+
+            if unique:  # don't leave the reserved (empty) file behind either
+                fn.unlink(missing_ok=True)
+            raise
 
         return (r, fn)
 
@@ -178,12 +249,10 @@ class TassWorker:
             - .results yields T across all pages
             - .data materializes all results as a list
 
-        :param top: maximum number of records per page returned in the response
-        :param offset: the number of records to advance/offset by on each pagination, this is used after the first
-                       page iteration and replaces the initial '$skip' value for all subsequent page iterations
-        :param skip: how many records to initially skip from; this defaults to 0 (skip no records); this value is
-                     overridden by 'offset' after the first page iteration"""
-        top, offset, skip = 100, 100, 0
+        :param top: maximum number of records per page returned in the response; each page advances '$skip' by this
+                    value, so no records are skipped or repeated between pages
+        :param skip: how many records to initially skip from; this defaults to 0 (skip no records)"""
+        top, skip = 100, 0
 
         # snapshot base params once; keeps other OData params stable
         base_params = dict(kwargs.get("params") or {})
@@ -196,27 +265,105 @@ class TassWorker:
             page_top = int(base_params["$top"])
             page = 0
 
-            while True:
-                # build params for this request; keep everything from 'base_params'
-                new_params = dict(base_params)
-                new_params["$skip"] = current_skip
-
-                # build kwargs for this request; keep everything from kwargs but inject params for this request
-                req_kw = dict(kwargs)
-                req_kw["params"] = new_params
+            # build params and kwargs once per pager; keep everything from 'base_params' and kwargs but inject params
+            # for the requests, only '$skip' changes between requests (params are encoded into the url on request)
+            params = dict(base_params)
+            req_kw = dict(kwargs)
+            req_kw["params"] = params
 
+            while True:
+                params["$skip"] = current_skip
                 resp = self._get(*args, **req_kw)  # should return 'APIResponse'
 
                 yield Page(response=resp, offset=current_skip, top=page_top, page_num=page)
 
-                if not resp.has_more:
+                # '$top' is already known, so skip parsing it back out of the response url
+                if not resp._has_more(expected=page_top):
                     break
 
-                current_skip += offset
+                current_skip += page_top
                 page += 1
 
         return PaginatedResult(pager)
 
+    def paginate_concurrent(self, *args, concurrency: int = 4, **kwargs) -> PaginatedResult[T]:
+        """Paginate an endpoint that supports OData style '$top'/'$skip' the same way as 'paginate', but keep up to
+        'concurrency' page requests in flight using a thread pool sharing the session (and its connection pool). Each
+        page is decoded on the worker thread that fetched it, so decoding overlaps with the requests still in flight.
+        Pages are yielded in order; any pages requested past the last page are discarded. Returns a PaginatedResult.
+        :param concurrency: the maximum number of page requests in flight at the same time; default is 4"""
+        top, skip = 100, 0
+        inflight = max(1, concurrency)
+
+        # snapshot base params once; keeps other OData params stable
+        base_params = dict(kwargs.get("params") or {})
+        base_params.setdefault("$top", top)
+        base_params.setdefault("$skip", skip)
+
+        def fetch(page_skip: int) -> APIResponse:
+            # each request needs its own params as requests are made concurrently
+            req_kw = dict(kwargs)
+            req_kw["params"] = {**base_params, "$skip": page_skip}
+            resp = self._get(*args, **req_kw)  # should return 'APIResponse'
+            resp.data  # decode on this thread; 'data' is cached on the response
+
+            return resp
+
+        def pager() -> Iterator[Page[T]]:
+            start_skip = int(base_params["$skip"])
+            page_top = int(base_params["$top"])
+            pending: deque[tuple[int, Future[APIResponse]]] = deque()
+            requested = 0
+            page = 0
+
+            executor = ThreadPoolExecutor(max_workers=inflight)
+
+            def submit_next() -> None:
+                nonlocal requested
+                page_skip = start_skip + requested * page_top
+                pending.append((page_skip, executor.submit(fetch, page_skip)))
+                requested += 1
+
+            try:
+                for _ in range(inflight):
+                    submit_next()
+
+                while pending:
+                    page_skip, future = pending.popleft()
+                    resp = future.result()
+
+                    yield Page(response=resp, offset=page_skip, top=page_top, page_num=page)
+
+                    if not resp._has_more(expected=page_top):
+                        return
+
+                    page += 1
+                    submit_next()  # keep the pipeline full
+            finally:
+                # requests past the last page (or after an error) are not needed; cancel the ones that have not started
+                # and don't wait for the ones already in flight, their results are discarded
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return PaginatedResult(pager)
+
+    def map_concurrent(self, fn: Callable[[T], R], items: Iterable[T], *, max_workers: int = 8) -> list[R | Exception]:
+        """Call 'fn' for each item using a thread pool sharing the session (and its connection pool), so requests
+        overlap. Returns one entry per item in the same order as 'items': the value returned by 'fn', or the exception
+        it raised. Exceptions are not re-raised, so a partial failure doesn't hide which calls succeeded (for example
+        which uploads were created and must not be retried).
+        :param fn: callable that takes a single item
+        :param items: items to call 'fn' with
+        :param max_workers: the maximum number of calls made at the same time; default is 8"""
+        def call(item: T) -> R | Exception:
+            try:
+                return fn(item)
+            except Exception as e:
+                log.error(f"concurrent call failed for {item!r}: {e}")
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(call, items))
+
     @request("PATCH")
     def _patch(self, *args, **kwargs) -> requests.Response:
         """Perform HTTP 'PATCH'."""
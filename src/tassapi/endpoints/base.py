@@ -1,14 +1,80 @@
 import json
 
-from functools import cached_property
+from collections.abc import Iterable
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Optional
 
+from .subpaths import NotesSubPaths
 from ..api.worker import TassWorker
 from ..api.protocols import APISession
+from ..utils.cache_utils import ttl_lru_cache
 from ..utils.datetime_utils import timestamp_now_as_str, today_midnight_ts, today_as_str
 from ..utils.json_patch_utils import _json_diff
 from ..utils.request_utils import merge_odata_filter_param
 
+CURRENT_DATE_FILTER_TMPL = "doe le {doe} and (dol ge {dol} or dol eq null)"
+FUTURE_DATE_FILTER_TMPL = "doe ge {doe}"
+OPTIONS_CACHE_TTL = 600.0  # seconds; options are per company configuration that rarely changes
+
+# (attachments, attachment) path templates per notes sub-path, shared by every notes endpoint instance; positional
+# fields are the owner code (student/employee code), note uid, and attachment id
+NOTES_ATTACHMENT_TMPLS: dict[type, tuple[str, str]] = {
+    subpath: (
+        f"{{}}/{subpath.path}/{{}}/{subpath.attachments.path}",
+        f"{{}}/{subpath.path}/{{}}/{subpath.attachments.path}/{{}}",
+    )
+    for subpath in (NotesSubPaths.confidential, NotesSubPaths.standard)
+}
+
+# (date ordinal, 'today' string, 'today midnight' string); shared by all endpoints (and threads), rebuilt when the date
+# changes; replaced as a whole tuple, so readers always see a complete entry
+_today_cache: tuple[int, str, str] = (0, "", "")
+
+
+def _today_strings() -> tuple[str, str]:
+    """Return today's date string and today's midnight timestamp string, from a module level cache shared by every
+    endpoint that is rebuilt on the first call of each day. Thread safe: the cache is replaced by a single assignment,
+    at worst two threads both rebuild it when the date changes."""
+    global _today_cache
+    today_ord = date.today().toordinal()
+
+    if today_ord != _today_cache[0]:
+        _today_cache = (today_ord, today_as_str(), today_midnight_ts())
+
+    return _today_cache[1:]
+
+
+@lru_cache(maxsize=16)
+def current_date_filter(doe: str, dol: str) -> str:
+    """OData filter for records current between a date of entry and date of leaving, cached as the same dates (usually
+    today) are used repeatedly.
+    :param doe: date of entry string, for example '2026-01-01'
+    :param dol: date of leaving string, for example '2026-12-31'"""
+    return CURRENT_DATE_FILTER_TMPL.format(doe=doe, dol=dol)
+
+
+@lru_cache(maxsize=16)
+def future_date_filter(doe: str) -> str:
+    """OData filter for records with a date of entry on or after a given date, cached as the same date (usually today)
+    is used repeatedly.
+    :param doe: date of entry string, for example '2026-01-01'"""
+    return FUTURE_DATE_FILTER_TMPL.format(doe=doe)
+
+
+def endpoint_cache_key(endpoint: "EndpointBase") -> tuple[str, str, Optional[str]]:
+    """Key identifying the resource an endpoint instance represents (server, company, endpoint path), so cached results
+    are never shared between servers or companies.
+    :param endpoint: endpoint instance"""
+    server = endpoint.session.server
+    return (server.base, server.cmpy_code, endpoint.endpoint)
+
+
+# cache for options endpoint methods that take no arguments; every call gets its own response wrapper (decoded from
+# the cached response content), so callers modifying the returned data don't affect each other
+options_cache = ttl_lru_cache(maxsize=64, ttl=OPTIONS_CACHE_TTL, key=endpoint_cache_key, copy=lambda resp: resp.copy())
+
 
 class EndpointBase(TassWorker):
     """Endpoint base class.
@@ -16,11 +82,13 @@ class EndpointBase(TassWorker):
         - Inherits 'TassWorker' for all HTTP work.
         - Inherited by endpoint class implementations to access the helper methods and properties that might be
         required in various endpoint implementations.
-        - Provides cached properties that return several date objects as string values, such as:
+        - Provides helpers that return several date objects as string values, such as:
             - self.today - returns YYYY-mm-dd formatted string
             - self.today_midnight - returns YYYY-mm-ddT00:00:00.000 formatted string
             - self.timestamp_now(fmt=fmt) - returns YYYY-mm-ddTHH:MM:SS.fff formatted string; 'fmt' is an optional
                                             datetime format string template
+          'today' and 'today_midnight' are not cached per instance; they read a module level cache that is shared by
+          every endpoint (and thread safe), rebuilt once per day when the date changes.
 
     :param session: instance of APISession; this handles authentication for all endpoints that inherit this class
     :param endpoint: an optional string representing the endpoint path, this is generally a required value, but there
@@ -28,20 +96,25 @@ class EndpointBase(TassWorker):
                      implementing an endpoint class, the 'endpoint' param should be treated as required where it is
                      required for that implementation)"""
 
+    # endpoints that cache sub-endpoints with 'cached_property' don't declare slots, so keep a '__dict__'
+    __slots__ = ("endpoint",)
+
     def __init__(self, session: APISession, *, endpoint: Optional[str] = None) -> None:
         super().__init__(session)
         self.endpoint = endpoint  # this is generally a required value, but sometimes it's optional
 
-    @cached_property
+    @property
     def today(self) -> str:
-        """Today's date as a string, cached. Returns 'YYYY-mm-dd' formatted date string."""
-        return today_as_str()
+        """Today's date as a string, from the per day cache shared by all endpoints. Returns 'YYYY-mm-dd' formatted date
+        string."""
+        return _today_strings()[0]
 
-    @cached_property
+    @property
     def today_midnight(self) -> str:
-        """Today's date as datetime string, cached. Returns 'YYYY-mm-ddT00:00:00.000' formatted datetime string.
+        """Today's date as datetime string, from the per day cache shared by all endpoints. Returns
+        'YYYY-mm-ddT00:00:00.000' formatted datetime string.
         Microseconds precision is capped to 3, if microseconds are not required, trim the last four characters '.000'"""
-        return today_midnight_ts()
+        return _today_strings()[1]
 
     def as_json_patch(self, from_obj: Any, to_obj: Any) -> list[dict[str, Any]]:
         """Create a JSON patch object for patching data where JSON patch is required."""
@@ -62,3 +135,40 @@ class EndpointBase(TassWorker):
         Microseconds precision is capped to 3, if microseconds are not required, trim the last four characters '.fff'
         :param fmt: optional format string template; for example '%Y-%m-%dT%H:%M:%S.%f' (default)"""
         return timestamp_now_as_str(fmt=fmt)
+
+
+class AttachmentBatchMixin:
+    """Batch attachment transfers for endpoints implementing 'download_attachment(code, uid, attach_id, ...)' and
+    'upload_attachment(code, uid, *, fp, ...)' (notes and UD areas); mixed in ahead of 'EndpointBase'. Transfers run
+    over 'map_concurrent', so the result for each item is either the normal return value or the exception raised."""
+
+    __slots__ = ()
+
+    def batch_download_attachments(
+        self,
+        items: Iterable[tuple[str, str, str]],
+        *,
+        dest: Optional[Path] = None,
+        max_workers: int = 8,
+        **kwargs
+    ):
+        """Download several attachments at a time. Returns the result of 'download_attachment' (or the exception it
+        raised) for each item, in the same order as 'items'. Existing files are never overwritten and attachments with
+        the same remote filename are each written to their own file ('scan.pdf', 'scan (1).pdf', ...).
+        :param items: (owner code, note uid/area code, attach_id) tuples
+        :param dest: optionally override the default directory where content will be stored
+        :param max_workers: the maximum number of downloads at the same time; default is 8"""
+        kwargs["unique"] = True
+
+        return self.map_concurrent(
+            lambda item: self.download_attachment(*item, dest=dest, **kwargs), items, max_workers=max_workers
+        )
+
+    def batch_upload_attachments(self, items: Iterable[tuple[str, str, Path]], *, max_workers: int = 8, **kwargs):
+        """Upload several attachments at a time. Returns the result of 'upload_attachment' (or the exception it raised)
+        for each item, in the same order as 'items'; only the failed items need to be retried.
+        :param items: (owner code, note uid/area code, fp) tuples
+        :param max_workers: the maximum number of uploads at the same time; default is 8"""
+        return self.map_concurrent(
+            lambda item: self.upload_attachment(item[0], item[1], fp=item[2], **kwargs), items, max_workers=max_workers
+        )
@@ -1,20 +1,24 @@
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-from .base import EndpointBase
+from .base import NOTES_ATTACHMENT_TMPLS, AttachmentBatchMixin, EndpointBase, current_date_filter, future_date_filter
 from .options.employees import EmployeeOptions
 from .subpaths import NotesSubPaths, PhotosSubPath, UDAreasSubPath
 from ..api.protocols import APISession
 from ..utils.typehints import PayloadObject
 
 
-class EmployeeNotes(EndpointBase):
+class EmployeeNotes(AttachmentBatchMixin, EndpointBase):
+    __slots__ = ("subpath", "_attachments_tmpl", "_attachment_tmpl")
+
     new_obj_keys = ("note_cat", "note_text", "note_date")
 
     def __init__(self, session: APISession, endpoint: str, note_type: Optional[str] = None) -> None:
         super().__init__(session)
         self.endpoint = endpoint
         self.subpath = NotesSubPaths.confidential if note_type == "confidential" else NotesSubPaths.standard
+        self._attachments_tmpl, self._attachment_tmpl = NOTES_ATTACHMENT_TMPLS[self.subpath]  # shared templates
 
     def create(self, emp_code: str, payload: PayloadObject, **kwargs):
         """Create an employee note.
@@ -37,7 +41,7 @@ class EmployeeNotes(EndpointBase):
         such as file name, file size, date uploaded, and the 'attach_id' which is required to download an attachment.
         :param emp_code: employee code
         :param note_uid: note uid"""
-        return self._get(emp_code, self.subpath.path, note_uid, self.subpath.attachments.path, **kwargs)
+        return self._get(self._attachments_tmpl.format(emp_code, note_uid), **kwargs)
 
     def download_attachment(
         self,
@@ -54,8 +58,8 @@ class EmployeeNotes(EndpointBase):
         :param note_uid: note uid
         :param attach_id: attachment code
         :param dest: optionally overried the default directory where content will be stored"""
-        paths = (emp_code, self.subpath.path, note_uid, self.subpath.attachments.path, attach_id)
-        return super().download(*paths, dest=dest, out_fn=out_fn, **kwargs)
+        path = self._attachment_tmpl.format(emp_code, note_uid, attach_id)
+        return super().download(path, dest=dest, out_fn=out_fn, **kwargs)
 
     def upload_attachment(
         self,
@@ -69,13 +73,18 @@ class EmployeeNotes(EndpointBase):
         :param emp_code: employee code
         :param note_uid: note uid
         :param fp: path object"""
-        paths = (emp_code, self.subpath.path, note_uid, self.subpath.attachments.path)
-        return super().upload(*paths, fp=fp, **kwargs)
+        path = self._attachments_tmpl.format(emp_code, note_uid)
+        return super().upload(path, fp=fp, **kwargs)
 
 
 class EmployeePhotos(EndpointBase):
     """Employee photos endpoint."""
 
+    __slots__ = ("subpath",)
+
+    # static, so joined once with the class rather than looked up through the sub-path classes on every call
+    _changes_path = f"{PhotosSubPath.path}/{PhotosSubPath.changes.path}"
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
@@ -83,7 +92,7 @@ class EmployeePhotos(EndpointBase):
 
     def download_photos(self, emp_code: str, *, dest: Optional[Path] = None, out_fn: Optional[str] = None, **kwargs):
         """Downloads the ZIP file containing the photo and thumbnail."""
-        return super().download(emp_code, self.subpath.path, dest=dest, out_fn=out_fn)
+        return super().download(emp_code, self.subpath.path, dest=dest, out_fn=out_fn, **kwargs)
 
     def get_change_history(self, change_key: Optional[str] = None, **kwargs):
         """Get photo change history. If 'change_key' is not provided, then all changes are returned; if a value
@@ -91,8 +100,7 @@ class EmployeePhotos(EndpointBase):
 
         To get valid values for 'change_key' this method must be called without a value provided.
         :param change_key: optional change key"""
-        paths = (self.subpath.path, self.subpath.changes.path, change_key)
-        return self._get(*paths, **kwargs)
+        return self._get(self._changes_path, change_key, **kwargs)
 
     def upload_photo(
         self,
@@ -108,9 +116,15 @@ class EmployeePhotos(EndpointBase):
         return super().upload(*paths, fp=fp, **kwargs)
 
 
-class EmployeeUDAreas(EndpointBase):
+class EmployeeUDAreas(AttachmentBatchMixin, EndpointBase):
     """Employee UD areas endpoint."""
 
+    __slots__ = ("subpath",)
+
+    # path templates built once with the class; positional fields are the owner code, area code, and attachment id
+    _attachments_tmpl = f"{{}}/{UDAreasSubPath.path}/{{}}/{UDAreasSubPath.attachments.path}"
+    _attachment_tmpl = f"{_attachments_tmpl}/{{}}"
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
@@ -169,8 +183,8 @@ class EmployeeUDAreas(EndpointBase):
         :param area_code: area code
         :param attach_id: attachment code
         :param dest: optionally overried the default directory where content will be stored"""
-        paths = (emp_code, self.subpath.path, area_code, self.subpath.attachments.path, attach_id)
-        return super().download(*paths, dest=dest, out_fn=out_fn, **kwargs)
+        path = self._attachment_tmpl.format(emp_code, area_code, attach_id)
+        return super().download(path, dest=dest, out_fn=out_fn, **kwargs)
 
     def upload_attachment(
         self,
@@ -184,8 +198,8 @@ class EmployeeUDAreas(EndpointBase):
         :param emp_code: employee code
         :param area_code: area code
         :param fp: path object"""
-        paths = (emp_code, self.subpath.path, area_code, self.subpath.attachments.path)
-        return super().upload(*paths, fp=fp, **kwargs)
+        path = self._attachments_tmpl.format(emp_code, area_code)
+        return super().upload(path, fp=fp, **kwargs)
 
 
 class Employees(EndpointBase):
@@ -194,13 +208,27 @@ class Employees(EndpointBase):
     def __init__(self, session: APISession, *, endpoint: str = "employees") -> None:
         super().__init__(session)
         self.endpoint = endpoint
-        self.confidential_notes: EmployeeNotes = EmployeeNotes(
-            session, endpoint=self.endpoint, note_type="confidential"
-        )
-        self.standard_notes: EmployeeNotes = EmployeeNotes(session, endpoint=self.endpoint)
-        self.photos: EmployeePhotos = EmployeePhotos(session, endpoint=self.endpoint)
 
-        self.options: EmployeeOptions = EmployeeOptions(session, endpoint=self.endpoint)
+    # sub-endpoints are created on first access
+    @cached_property
+    def confidential_notes(self) -> EmployeeNotes:
+        """Employee confidential notes sub-endpoint."""
+        return EmployeeNotes(self.session, endpoint=self.endpoint, note_type="confidential")
+
+    @cached_property
+    def standard_notes(self) -> EmployeeNotes:
+        """Employee standard notes sub-endpoint."""
+        return EmployeeNotes(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def photos(self) -> EmployeePhotos:
+        """Employee photos sub-endpoint."""
+        return EmployeePhotos(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def options(self) -> EmployeeOptions:
+        """Employee options endpoint."""
+        return EmployeeOptions(self.session)
 
     def get(self, emp_code, **kwargs):
         """Get an employee."""
@@ -210,6 +238,11 @@ class Employees(EndpointBase):
         """Get all employees."""
         return self.paginate(**kwargs)
 
+    def get_all_concurrent(self, *, concurrency: int = 4, **kwargs):
+        """Get all employees, fetching several pages at a time.
+        :param concurrency: the maximum number of pages requested at the same time"""
+        return self.paginate_concurrent(concurrency=concurrency, **kwargs)
+
     def modify(self, emp_code: str, *, payload: PayloadObject, **kwargs):
         """Modify (PUT) the employee record. Requires a full object, not a patch.
         :param emp_code: employee code
@@ -222,27 +255,39 @@ class Employees(EndpointBase):
         :param payload: employee object"""
         return self._patch(emp_code, data=payload, **kwargs)
 
-    def get_current(self, doe: Optional[str] = None, dol: Optional[str] = None, **kwargs):
+    def get_current(
+        self,
+        doe: Optional[str] = None,
+        dol: Optional[str] = None,
+        *,
+        concurrency: Optional[int] = None,
+        **kwargs
+    ):
         """Convenience method for getting current employees. Note, the date of leaving ('dol') value in TASS is
         generally set to be the day after the employees actual last day; so if the employee's last day at school was the
         '2026-02-19' value, then the date of leaving should be entered in TASS as '2026-02-20'.
         OData filter uses 'ge' (greater than/equal to) for the date of leaving (or null), and 'le' (less than/equal to)
         for the date of entry.
         :param doe: optional date of entry string, for example '2026-01-01'
-        :param dol: optional date of leaving string, for example '2026-12-31'"""
-        doe = doe or self.today
-        dol = dol or self.today
-        date_fltr = f"doe le {doe} and (dol ge {dol} or dol eq null)"
+        :param dol: optional date of leaving string, for example '2026-12-31'
+        :param concurrency: optionally fetch up to this many pages at a time (see 'get_all_concurrent')"""
+        date_fltr = current_date_filter(doe or self.today, dol or self.today)
         kwargs = self.merge_filter_param(date_fltr, kwargs=kwargs)
 
+        if concurrency:
+            return self.get_all_concurrent(concurrency=concurrency, **kwargs)
+
         return self.get_all(**kwargs)
 
-    def get_future(self, doe: Optional[str] = None, **kwargs):
+    def get_future(self, doe: Optional[str] = None, *, concurrency: Optional[int] = None, **kwargs):
         """Convenience method for getting any future 'current' employees that have been migrated to 'current', but
         where their doe value does not yet make them current. The OData filter used is 'ge' (greater than/equal to)
-        :param doe: optional date of entry string, for example '2026-01-01'"""
-        doe = self.today
-        date_fltr = f"doe ge {doe}"
+        :param doe: optional date of entry string, for example '2026-01-01'
+        :param concurrency: optionally fetch up to this many pages at a time (see 'get_all_concurrent')"""
+        date_fltr = future_date_filter(doe or self.today)
         kwargs = self.merge_filter_param(date_fltr, kwargs=kwargs)
 
+        if concurrency:
+            return self.get_all_concurrent(concurrency=concurrency, **kwargs)
+
         return self.get_all(**kwargs)
@@ -7,6 +7,8 @@ class UDAreasOptions(EndpointBase):
     so only basic class setup is provided here. This class should be inherited by other classes that implemment
     UD area endpoints."""
 
+    __slots__ = ("subpath",)
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
@@ -27,6 +29,8 @@ class UDFieldsOptions(EndpointBase):
     so only basic class setup is provided here. This class should be inherited by other classes that implemment
     UD area endpoints."""
 
+    __slots__ = ("subpath",)
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
@@ -1,16 +1,21 @@
+from functools import cached_property
+
 from .common_options import UDAreasOptions as EmployeeUDAreasOptions
-from ..base import EndpointBase
+from ..base import EndpointBase, options_cache
 from ...api.protocols import APISession
 
 
 class EmployeeNotesOptions(EndpointBase):
     """Employee notes endpoint."""
 
+    __slots__ = ("subpath",)
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
         self.subpath = "notes"  # options endpoint doesn't care about confidential/standard types
 
+    @options_cache
     def categories(self):
         """Get note categories. Values returned here are identical across confidential/standard note types."""
         return self._get(self.subpath, "categories")
@@ -22,41 +27,59 @@ class EmployeeOptions(EndpointBase):
     def __init__(self, session: APISession, *, endpoint: str = "options/employees") -> None:
         super().__init__(session)
         self.endpoint = endpoint
-        self.notes: EmployeeNotesOptions = EmployeeNotesOptions(session, endpoint=self.endpoint)
-        self.ud_areas: EmployeeUDAreasOptions = EmployeeUDAreasOptions(session, endpoint=self.endpoint)
 
+    # sub-endpoints are created on first access
+    @cached_property
+    def notes(self) -> EmployeeNotesOptions:
+        """Employee notes options sub-endpoint."""
+        return EmployeeNotesOptions(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def ud_areas(self) -> EmployeeUDAreasOptions:
+        """Employee UD areas options sub-endpoint."""
+        return EmployeeUDAreasOptions(self.session, endpoint=self.endpoint)
+
+    @options_cache
     def countries(self):
         """Get country options."""
         return self._get("countries")
 
+    @options_cache
     def employee_statuses(self):
         """Get employee status types."""
         return self._get("statuses")
 
+    @options_cache
     def genders(self):
         """Get employee genders."""
         return self._get("genders")
 
+    @options_cache
     def indigenous_types(self):
         """Get indigenous types."""
         return self._get("indigenoustypes")
 
+    @options_cache
     def main_activities(self):
         """Get employee main activity types."""
         return self._get("mainactivities")
 
+    @options_cache
     def marital_statuses(self):
         """Get marital statuses."""
         return self._get("maritalstatuses")
 
+    @options_cache
     def termination_reasons(self):
         """Get termination reasons."""
         return self._get("terminationreasons")
 
+    @options_cache
     def titles(self):
         """Get employee title prefixes (honorifics)."""
         return self._get("titles")
 
+    @options_cache
     def vendors(self):
         """Get vendors."""
         return self._get("vendors")
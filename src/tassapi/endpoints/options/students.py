@@ -1,8 +1,10 @@
+from functools import cached_property
+
 from .common_options import (
     UDAreasOptions as StudentUDAreasOptions,
     UDFieldsOptions as StudentUDFieldsOptions,
 )
-from ..base import EndpointBase
+from ..base import EndpointBase, options_cache
 from ..subpaths.students import StudentCommunicationRulesSubPath
 from ...api.protocols import APISession
 
@@ -10,15 +12,19 @@ from ...api.protocols import APISession
 class StudentCommunicationRulesOptions(EndpointBase):
     """Student communication rules options endpoint."""
 
+    __slots__ = ("subpath",)
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
         self.subpath = StudentCommunicationRulesSubPath
 
+    @options_cache
     def comm_rule_types(self):
         """Get communication rules types."""
         return self._get(self.subpath.path, "types")
 
+    @options_cache
     def genders(self):
         """Get genders."""
         return self._get(self.subpath.path, "genders")
@@ -27,11 +33,14 @@ class StudentCommunicationRulesOptions(EndpointBase):
 class StudentNotesOptions(EndpointBase):
     """Student notes endpoint."""
 
+    __slots__ = ("subpath",)
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
         self.subpath = "notes"  # options endpoint doesn't care about confidential/standard types
 
+    @options_cache
     def categories(self):
         """Get note categories. Values returned here are identical across confidential/standard note types."""
         return self._get(self.subpath, "categories")
@@ -43,45 +52,69 @@ class StudentOptions(EndpointBase):
     def __init__(self, session: APISession, *, endpoint: str = "options/students") -> None:
         super().__init__(session)
         self.endpoint = endpoint
-        self.communication_rules: StudentCommunicationRulesOptions = StudentCommunicationRulesOptions(
-            session, endpoint=self.endpoint
-        )
-        self.notes: StudentNotesOptions = StudentNotesOptions(session, endpoint=self.endpoint)
-        self.ud_areas: StudentUDAreasOptions = StudentUDAreasOptions(session, endpoint=self.endpoint)
-        self.ud_fields: StudentUDFieldsOptions = StudentUDFieldsOptions(session, endpoint=self.endpoint)
 
+    # sub-endpoints are created on first access
+    @cached_property
+    def communication_rules(self) -> StudentCommunicationRulesOptions:
+        """Student communication rules options sub-endpoint."""
+        return StudentCommunicationRulesOptions(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def notes(self) -> StudentNotesOptions:
+        """Student notes options sub-endpoint."""
+        return StudentNotesOptions(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def ud_areas(self) -> StudentUDAreasOptions:
+        """Student UD areas options sub-endpoint."""
+        return StudentUDAreasOptions(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def ud_fields(self) -> StudentUDFieldsOptions:
+        """Student UD fields options sub-endpoint."""
+        return StudentUDFieldsOptions(self.session, endpoint=self.endpoint)
+
+    @options_cache
     def campuses(self):
         """Get campus options."""
         return self._get("campuses")
 
+    @options_cache
     def comparative_reporting_types(self):
         """Get comparative reporting types."""
         return self._get("comparativereportingtypes")
 
+    @options_cache
     def feeder_schools(self):
         """Get feeder schools."""
         return self._get("feederschools")
 
+    @options_cache
     def houses(self):
         """Get houses."""
         return self._get("houses")
 
+    @options_cache
     def next_year_indicators(self):
         """Get next year indicators."""
         return self._get("nextyearindicators")
 
+    @options_cache
     def pc_tutor_groups(self):
         """Get PC/Tutor Groups."""
         return self._get("pctutorgroups")
 
+    @options_cache
     def religions(self):
         """Get religions."""
         return self._get("religions")
 
+    @options_cache
     def residency_statuses(self):
         """Get residency statuses."""
         return self._get("residencystatuses")
 
+    @options_cache
     def year_groups(self):
         """Get year groups."""
         return self._get("yeargroups")
@@ -1,7 +1,8 @@
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-from .base import EndpointBase
+from .base import NOTES_ATTACHMENT_TMPLS, AttachmentBatchMixin, EndpointBase, current_date_filter, future_date_filter
 from .options.students import StudentOptions
 from .subpaths import NotesSubPaths, PhotosSubPath, UDAreasSubPath, UDFieldsSubPath
 from .subpaths.students import StudentCommunicationRulesSubPath
@@ -12,6 +13,8 @@ from ..utils.typehints import PayloadObject
 class StudentCommunicationRules(EndpointBase):
     """Student communication rules endpoint."""
 
+    __slots__ = ("subpath",)
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
@@ -29,15 +32,18 @@ class StudentCommunicationRules(EndpointBase):
         return self._get(*paths, **kwargs)
 
 
-class StudentNotes(EndpointBase):
+class StudentNotes(AttachmentBatchMixin, EndpointBase):
     """Student notes endpoint."""
 
+    __slots__ = ("subpath", "_attachments_tmpl", "_attachment_tmpl")
+
     new_obj_keys = ("note_cat", "note_text", "note_date")
 
     def __init__(self, session: APISession, endpoint: str, note_type: Optional[str] = None) -> None:
         super().__init__(session)
         self.endpoint = endpoint
         self.subpath = NotesSubPaths.confidential if note_type == "confidential" else NotesSubPaths.standard
+        self._attachments_tmpl, self._attachment_tmpl = NOTES_ATTACHMENT_TMPLS[self.subpath]  # shared templates
 
     def create(self, stud_code: str, *, payload: PayloadObject, **kwargs):
         """Create an student note.
@@ -55,12 +61,17 @@ class StudentNotes(EndpointBase):
         """Get all notes for a given student."""
         return self.paginate(stud_code, self.subpath.path, **kwargs)
 
+    def get_all_concurrent(self, stud_code: str, *, concurrency: int = 4, **kwargs):
+        """Get all notes for a given student, fetching several pages at a time.
+        :param concurrency: the maximum number of pages requested at the same time"""
+        return self.paginate_concurrent(stud_code, self.subpath.path, concurrency=concurrency, **kwargs)
+
     def get_attachments(self, stud_code: str, note_uid: str, **kwargs):
         """Get attachments for a given note. This does not download the attachment but returns attachment information
         such as file name, file size, date uploaded, and the 'attach_id' which is required to download an attachment.
         :param stud_code: student code
         :param note_uid: note uid"""
-        return self._get(stud_code, self.subpath.path, note_uid, self.subpath.attachments.path, **kwargs)
+        return self._get(self._attachments_tmpl.format(stud_code, note_uid), **kwargs)
 
     def download_attachment(
         self,
@@ -77,8 +88,8 @@ class StudentNotes(EndpointBase):
         :param note_uid: note uid
         :param attach_id: attachment code
         :param dest: optionally overried the default directory where content will be stored"""
-        paths = (stud_code, self.subpath.path, note_uid, self.subpath.attachments.path, attach_id)
-        return super().download(*paths, dest=dest, out_fn=out_fn, **kwargs)
+        path = self._attachment_tmpl.format(stud_code, note_uid, attach_id)
+        return super().download(path, dest=dest, out_fn=out_fn, **kwargs)
 
     def upload_attachment(
         self,
@@ -92,13 +103,18 @@ class StudentNotes(EndpointBase):
         :param stud_code: student code
         :param note_uid: note uid
         :param fp: path object"""
-        paths = (stud_code, self.subpath.path, note_uid, self.subpath.attachments.path)
-        return super().upload(*paths, fp=fp, **kwargs)
+        path = self._attachments_tmpl.format(stud_code, note_uid)
+        return super().upload(path, fp=fp, **kwargs)
 
 
 class StudentPhotos(EndpointBase):
     """Student photos endpoint."""
 
+    __slots__ = ("subpath",)
+
+    # static, so joined once with the class rather than looked up through the sub-path classes on every call
+    _changes_path = f"{PhotosSubPath.path}/{PhotosSubPath.changes.path}"
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
@@ -106,7 +122,7 @@ class StudentPhotos(EndpointBase):
 
     def download_photos(self, stud_code: str, *, dest: Optional[Path] = None, out_fn: Optional[str] = None, **kwargs):
         """Downloads the ZIP file containing the photo and thumbnail."""
-        return super().download(stud_code, self.subpath.path, dest=dest, out_fn=out_fn)
+        return super().download(stud_code, self.subpath.path, dest=dest, out_fn=out_fn, **kwargs)
 
     def get_change_history(self, change_key: Optional[str] = None, **kwargs):
         """Get all the change history. If 'change_key' is not provided, then all changes are returned; if a value
@@ -114,8 +130,7 @@ class StudentPhotos(EndpointBase):
 
         To get valid values for 'change_key' this method must be called without a value provided.
         :param change_key: optional change key"""
-        paths = (self.subpath.path, self.subpath.changes.path, change_key)
-        return self._get(*paths, **kwargs)
+        return self._get(self._changes_path, change_key, **kwargs)
 
     def upload_photo(
         self,
@@ -131,9 +146,15 @@ class StudentPhotos(EndpointBase):
         return super().upload(*paths, fp=fp, **kwargs)
 
 
-class StudentUDAreas(EndpointBase):
+class StudentUDAreas(AttachmentBatchMixin, EndpointBase):
     """Student UD areas endpoint."""
 
+    __slots__ = ("subpath",)
+
+    # path templates built once with the class; positional fields are the owner code, area code, and attachment id
+    _attachments_tmpl = f"{{}}/{UDAreasSubPath.path}/{{}}/{UDAreasSubPath.attachments.path}"
+    _attachment_tmpl = f"{_attachments_tmpl}/{{}}"
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
@@ -192,8 +213,8 @@ class StudentUDAreas(EndpointBase):
         :param area_code: area code
         :param attach_id: attachment code
         :param dest: optionally overried the default directory where content will be stored"""
-        paths = (stud_code, self.subpath.path, area_code, self.subpath.attachments.path, attach_id)
-        return super().download(*paths, dest=dest, out_fn=out_fn, **kwargs)
+        path = self._attachment_tmpl.format(stud_code, area_code, attach_id)
+        return super().download(path, dest=dest, out_fn=out_fn, **kwargs)
 
     def upload_attachment(
         self,
@@ -207,13 +228,15 @@ class StudentUDAreas(EndpointBase):
         :param stud_code: student code
         :param area_code: area code
         :param fp: path object"""
-        paths = (stud_code, self.subpath.path, area_code, self.subpath.attachments.path)
-        return super().upload(*paths, fp=fp, **kwargs)
+        path = self._attachments_tmpl.format(stud_code, area_code)
+        return super().upload(path, fp=fp, **kwargs)
 
 
 class StudentUDFields(EndpointBase):
     """Student UD fields endpoint."""
 
+    __slots__ = ("subpath",)
+
     def __init__(self, session: APISession, endpoint: str) -> None:
         super().__init__(session)
         self.endpoint = endpoint
@@ -244,15 +267,37 @@ class Students(EndpointBase):
     def __init__(self, session: APISession, *, endpoint: str = "students") -> None:
         super().__init__(session)
         self.endpoint = endpoint
-        self.communication_rules: StudentCommunicationRules = StudentCommunicationRules(session, endpoint=self.endpoint)
-        self.confidential_notes: StudentNotes = StudentNotes(
-            session, endpoint=self.endpoint, note_type="confidential"
-        )
-        self.standard_notes: StudentNotes = StudentNotes(session, endpoint=self.endpoint)
-        self.photos: StudentPhotos = StudentPhotos(session, endpoint=self.endpoint)
-        self.ud_areas: StudentUDAreas = StudentUDAreas(session, endpoint=self.endpoint)
 
-        self.options: StudentOptions = StudentOptions(session)
+    # sub-endpoints are created on first access
+    @cached_property
+    def communication_rules(self) -> StudentCommunicationRules:
+        """Student communication rules sub-endpoint."""
+        return StudentCommunicationRules(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def confidential_notes(self) -> StudentNotes:
+        """Student confidential notes sub-endpoint."""
+        return StudentNotes(self.session, endpoint=self.endpoint, note_type="confidential")
+
+    @cached_property
+    def standard_notes(self) -> StudentNotes:
+        """Student standard notes sub-endpoint."""
+        return StudentNotes(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def photos(self) -> StudentPhotos:
+        """Student photos sub-endpoint."""
+        return StudentPhotos(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def ud_areas(self) -> StudentUDAreas:
+        """Student UD areas sub-endpoint."""
+        return StudentUDAreas(self.session, endpoint=self.endpoint)
+
+    @cached_property
+    def options(self) -> StudentOptions:
+        """Student options endpoint."""
+        return StudentOptions(self.session)
 
     def get(self, stud_code, **kwargs):
         """Get an student."""
@@ -262,6 +307,11 @@ class Students(EndpointBase):
         """Get all students."""
         return self.paginate(**kwargs)
 
+    def get_all_concurrent(self, *, concurrency: int = 4, **kwargs):
+        """Get all students, fetching several pages at a time.
+        :param concurrency: the maximum number of pages requested at the same time"""
+        return self.paginate_concurrent(concurrency=concurrency, **kwargs)
+
     def modify(self, stud_code: str, *, payload: PayloadObject, **kwargs):
         """Modify (PUT) the student record. Requires a full object, not a patch.
         :param stud_code: student code
@@ -274,27 +324,39 @@ class Students(EndpointBase):
         :param payload: student object"""
         return self._patch(stud_code, data=payload, **kwargs)
 
-    def get_current(self, doe: Optional[str] = None, dol: Optional[str] = None, **kwargs):
+    def get_current(
+        self,
+        doe: Optional[str] = None,
+        dol: Optional[str] = None,
+        *,
+        concurrency: Optional[int] = None,
+        **kwargs
+    ):
         """Convenience method for getting current students. Note, the date of leaving ('dol') value in TASS is
         generally set to be the day after the students actual last day; so if the student's last day at school was the
         '2026-02-19' value, then the date of leaving should be entered in TASS as '2026-02-20'.
         OData filter uses 'ge' (greater than/equal to) for the date of leaving (or null), and 'le' (less than/equal to)
         for the date of entry.
         :param doe: optional date of entry string, for example '2026-01-01'
-        :param dol: optional date of leaving string, for example '2026-12-31'"""
-        doe = doe or self.today
-        dol = dol or self.today
-        date_fltr = f"doe le {doe} and (dol ge {dol} or dol eq null)"
+        :param dol: optional date of leaving string, for example '2026-12-31'
+        :param concurrency: optionally fetch up to this many pages at a time (see 'get_all_concurrent')"""
+        date_fltr = current_date_filter(doe or self.today, dol or self.today)
         kwargs = self.merge_filter_param(date_fltr, kwargs=kwargs)
 
+        if concurrency:
+            return self.get_all_concurrent(concurrency=concurrency, **kwargs)
+
         return self.get_all(**kwargs)
 
-    def get_future(self, doe: Optional[str] = None, **kwargs):
+    def get_future(self, doe: Optional[str] = None, *, concurrency: Optional[int] = None, **kwargs):
         """Convenience method for getting any future 'current' students that have been migrated to 'current', but
         where their doe value does not yet make them current. The OData filter used is 'ge' (greater than/equal to)
-        :param doe: optional date of entry string, for example '2026-01-01'"""
-        doe = self.today
-        date_fltr = f"doe ge {doe}"
+        :param doe: optional date of entry string, for example '2026-01-01'
+        :param concurrency: optionally fetch up to this many pages at a time (see 'get_all_concurrent')"""
+        date_fltr = future_date_filter(doe or self.today)
         kwargs = self.merge_filter_param(date_fltr, kwargs=kwargs)
 
+        if concurrency:
+            return self.get_all_concurrent(concurrency=concurrency, **kwargs)
+
         return self.get_all(**kwargs)
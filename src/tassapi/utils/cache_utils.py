@@ -0,0 +1,63 @@
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import wraps
+from threading import Lock
+from typing import Any, Optional
+
+
+def ttl_lru_cache(
+    *,
+    maxsize: int = 64,
+    ttl: float = 600.0,
+    key: Callable[[Any], Hashable],
+    copy: Optional[Callable[[Any], Any]] = None,
+) -> Callable:
+    """Cache the result of a method that takes no arguments (other than 'self') for 'ttl' seconds. Results are keyed by
+    'key(self)' and the method's qualified name, so instances that represent the same resource share cached results.
+    The least recently used result is evicted when more than 'maxsize' results are cached. The decorated method has a
+    'cache_clear()' method to drop all cached results.
+    :param maxsize: maximum number of cached results
+    :param ttl: number of seconds a cached result is used for before it is fetched again
+    :param key: callable that returns a hashable key for the instance the method is called on
+    :param copy: optional callable applied to the cached result on every call (including the call that cached it), so
+                 mutable results aren't shared between callers"""
+    copy = copy or (lambda value: value)
+
+    def wrapper(fn: Callable) -> Callable:
+        cache: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        lock = Lock()
+
+        @wraps(fn)
+        def wrapped_fn(self) -> Any:
+            cache_key = (key(self), fn.__qualname__)
+            now = time.monotonic()
+
+            with lock:
+                cached = cache.get(cache_key)
+
+                if cached is not None and now - cached[0] < ttl:
+                    cache.move_to_end(cache_key)
+                    return copy(cached[1])
+
+            value = fn(self)
+
+            with lock:
+                cache[cache_key] = (now, value)
+                cache.move_to_end(cache_key)
+
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+            return copy(value)
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapped_fn.cache_clear = cache_clear
+
+        return wrapped_fn
+
+    return wrapper
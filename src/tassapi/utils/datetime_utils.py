@@ -3,7 +3,7 @@ import re
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from functools import partial
+from functools import lru_cache
 from typing import Any, ClassVar, Optional, TypeVar
 
 T = TypeVar("T")
@@ -11,14 +11,7 @@ Date = str | date
 Datetime = str | datetime
 
 
-fraction_re = re.compile(r"\.(\d+)")
-iso_date_ptn = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-iso_timestamp_ptn = re.compile(
-    r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])T([01]\d|2[0-3]):[0-5]\d:[0-5]\d(\.\d{0,6})?$"
-)
-
-odata_iso_date_ptn = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-odata_iso_timestamp_ptn = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:\d{2})?$")
+iso_fast_ptn = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:([T ])(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?)?", re.ASCII)
 
 
 def date_to_isoformat(value: Date | Datetime, raw: Optional[bool] = False) -> Optional[Datetime]:
@@ -28,50 +21,88 @@ def date_to_isoformat(value: Date | Datetime, raw: Optional[bool] = False) -> Op
     :param value: datetime value to convert
     :param raw: return native datetime value
     :param as_zulu: return 'Z' at end of date string instead of '+00:00'; default is True"""
-    result = datetime.fromisoformat(value).isoformat(timespec="microseconds").removesuffix("Z")
+    result = datetime.fromisoformat(value)
 
-    if "+" in result:
-        result = result.partition("+")[0]
-    elif "-" in result[10:]:  # avoid any '-' values in the date
-        result = result.partition("-")[0]
+    # dropping the tzinfo keeps the wall clock value, which is the same as stripping the offset from the string
+    if result.tzinfo is not None:
+        result = result.replace(tzinfo=None)
 
     if raw:
-        try:
-            return datetime.strptime(result, "%Y-%m-%dT%H:%M:%S.%f")
-        except ValueError:
-            raise
+        return result
 
-    return result
+    return result.isoformat(timespec="microseconds")
 
 
 def is_timestamp_string(s: str) -> bool:
     """Determine if a string value is a timestamp string that can be reformatted.
     :param s: string"""
     try:
-        return (
-            bool(datetime.fromisoformat(s))
-            and isinstance(s, str)
-            and all(char in s for char in ("T", "-", ":"))
-            and any(char.isdigit() for char in s)
-        )
-    except ValueError:
+        datetime.fromisoformat(s)
+    except (ValueError, TypeError):
         return False
 
+    # a successful parse guarantees digits; the separator checks reject dates and the ISO 'basic' format
+    return "T" in s and "-" in s and ":" in s
+
+
+# the validators below check fixed character positions instead of running a regex; 'isascii' is checked first so
+# 'isdigit' only accepts '0-9'
+
+
+def _is_date_prefix(s: str) -> bool:
+    """Return True/False if the first 10 characters of an ASCII string are 'YYYY-mm-dd' shaped (digits only, no range
+    checks).
+    :param s: string"""
+    return s[4] == "-" and s[7] == "-" and (s[:4] + s[5:7] + s[8:10]).isdigit()
+
+
+def _is_time_at(s: str, i: int) -> bool:
+    """Return True/False if the 8 characters of an ASCII string starting at 'i' are 'HH:MM:SS' shaped (digits only, no
+    range checks).
+    :param s: string
+    :param i: index of the first hour digit"""
+    return s[i + 2] == ":" and s[i + 5] == ":" and (s[i : i + 2] + s[i + 3 : i + 5] + s[i + 6 : i + 8]).isdigit()
+
 
 def is_iso_date(s: str) -> bool:
     """Return True/False if string matches ISO 8601 date format 'YYYY-mm-dd'.
     :param s: string"""
-    return bool(iso_date_ptn.fullmatch(s))
+    return len(s) == 10 and s.isascii() and _is_date_prefix(s)
 
 
 def is_iso_timetamp(s: str) -> bool:
     """Return True/False if string matches ISO 8601 date format 'YYYY-mm-ddTHH:MM:SSZ'"""
-    return bool(iso_timestamp_ptn.fullmatch(s))
+    n = len(s)
+
+    if not (19 <= n <= 26 and s.isascii() and s[10] == "T" and _is_date_prefix(s) and _is_time_at(s, 11)):
+        return False
+
+    # month 01-12, day 01-31, hour 00-23, minute/second 00-59; two digit strings compare the same as integers
+    if not ("01" <= s[5:7] <= "12" and "01" <= s[8:10] <= "31" and s[11:13] <= "23" and s[14] <= "5" and s[17] <= "5"):
+        return False
+
+    # optional fraction of up to 6 digits
+    return n == 19 or (s[19] == "." and (n == 20 or s[20:].isdigit()))
 
 
 def is_odata_date_str(v: str) -> bool:
     """Is ISO8601 YYYY-mm-dd or YYYY-mm-ddTHH:MM:SSZ pattern recognized as Edm.Date/Edm.DateTimeOffset values."""
-    return bool(odata_iso_date_ptn.fullmatch(v) or odata_iso_timestamp_ptn.fullmatch(v))
+    n = len(v)
+
+    if n not in (10, 19, 20, 25) or not v.isascii() or not _is_date_prefix(v):
+        return False
+
+    if n == 10:
+        return True
+
+    if v[10] != "T" or not _is_time_at(v, 11):
+        return False
+
+    if n == 20:
+        return v[19] == "Z"
+
+    # offset, '+HH:MM' or '-HH:MM'
+    return n == 19 or (v[19] in "+-" and v[22] == ":" and (v[20:22] + v[23:25]).isdigit())
 
 
 def datetime_to_string(dt: datetime, *, fmt: Optional[str] = None, precision: Optional[int] = None) -> str:
@@ -83,16 +114,31 @@ def datetime_to_string(dt: datetime, *, fmt: Optional[str] = None, precision: Op
     precision = int(precision or 3)
 
     if "%f" in fmt and precision:
-        new_fmt = fmt.replace("%f", "")
-        old_ms = dt.strftime("%f")
-        new_ms = old_ms[:-precision].ljust(precision, "0")
-        out = f"{dt.strftime(new_fmt)}{new_ms}"
+        out = _strftime_with_fraction(dt, fmt, precision)
     else:
         out = dt.strftime(fmt)
 
     return out
 
 
+@lru_cache(maxsize=32)
+def _split_fraction_fmt(fmt: str) -> tuple[str, ...]:
+    """Split a format string on '%f'; cached as the same handful of formats are used for every value.
+    :param fmt: datetime format string"""
+    return tuple(fmt.split("%f"))
+
+
+def _strftime_with_fraction(dt: datetime, fmt: str, precision: int) -> str:
+    """Like 'strftime' but '%f' is replaced with the first 'precision' digits of the microseconds; the fraction is
+    built from the integer instead of a separate 'strftime("%f")' call.
+    :param dt: datetime object
+    :param fmt: datetime format string containing '%f'
+    :param precision: number of fractional digits to keep"""
+    frac = f"{dt.microsecond:06d}"[:precision]
+
+    return frac.join(datetime.strftime(dt, part) if part else "" for part in _split_fraction_fmt(fmt))
+
+
 @dataclass(frozen=True)
 class DateTimeFormats:
     date_fmt: ClassVar[str] = '%Y-%m-%d'
@@ -146,8 +192,35 @@ class DateTimeFormats:
     )
 
 
+# module level aliases of the defaults for the per-value parsing paths (a global lookup rather than a class attribute
+# lookup); the candidates tuple is the same object, so 'is' checks against either name are equivalent
+_DEFAULT_CANDIDATES = DateTimeFormats.candidates
+_DEFAULT_MS_PRECISION = DateTimeFormats.ms_precision
+_DEFAULT_FIELD_SET = frozenset(field.casefold() for field in DateTimeFormats.field_candidates)
+
+
+def _strip_candidates(formats: Sequence[str]) -> tuple[tuple[str, str], ...]:
+    """Pair each format string with its 'strptime' equivalent ('Z' suffix removed, as it is normalized out of the
+    input before parsing).
+    :param formats: sequence of formats"""
+    return tuple((fmt, fmt.removesuffix("Z")) for fmt in formats)
+
+
+_CANDIDATES_STRIPPED = _strip_candidates(_DEFAULT_CANDIDATES)
+
+
+@lru_cache(maxsize=32)
+def _casefolded_set(field_candidates: tuple[str, ...]) -> frozenset[str]:
+    """Casefolded set of custom field candidates; cached as hooks are called once per JSON object.
+    :param field_candidates: tuple of fieldnames"""
+    return frozenset(field.casefold() for field in field_candidates)
+
+
 def _clamp_ms_precision(v: Any) -> int:
     """Clamp the microsecond precision to the range 0-6."""
+    if type(v) is int:
+        return 0 if v < 0 else 6 if v > 6 else v
+
     try:
         n = int(v)
     except Exception:
@@ -197,6 +270,8 @@ class ParsedDatetime(datetime):
     :param parse_method: optional indicator of how the datetime was parsed, such as 'derived', 'manual', 'strftime'
     :param had_z: bool; indicates the original string value had a 'Z' suffix indicating UTC/Zulu time"""
 
+    __slots__ = ("fmt", "ms_precision", "parse_method", "had_z")
+
     fmt: Optional[str]
     ms_precision: int
     parse_method: Optional[str]
@@ -224,7 +299,9 @@ class ParsedDatetime(datetime):
         )
 
         obj.fmt = fmt
-        obj.ms_precision = _clamp_ms_precision(ms_precision)
+        # skip the clamping call for the common in-range int
+        in_range = type(ms_precision) is int and 0 <= ms_precision <= 6
+        obj.ms_precision = ms_precision if in_range else _clamp_ms_precision(ms_precision)
         obj.parse_method = parse_method
         obj.had_z = bool(had_z)
 
@@ -233,15 +310,30 @@ class ParsedDatetime(datetime):
     def _as_datetime(self) -> datetime:
         """Return plain stdlib datetime with the same timestamp fields as self. Used internally for various dunder
         methods."""
-        return datetime(
-            self.year, self.month, self.day, self.hour, self.minute, self.second, self.microsecond, tzinfo=self.tzinfo
-        )
+        return datetime.combine(self.date(), self.timetz())
 
     def _wrap(self, base: datetime, *, method: Optional[str]) -> "ParsedDatetime":
         """Wrap a datetime result back into ParsedDatetime, carry metadata forward.
         Keep fmt/ms_precision (still useful for formatting), but adjust parse_method to reflect
         the value is no longer the original parsed."""
-        return type(self)(base, fmt=self.fmt, ms_precision=self.ms_precision, parse_method=method, had_z=self.had_z)
+        # metadata is copied from an existing instance, so '__new__' (and its precision clamping) can be skipped
+        obj = datetime.__new__(
+            type(self),
+            base.year,
+            base.month,
+            base.day,
+            base.hour,
+            base.minute,
+            base.second,
+            base.microsecond,
+            tzinfo=base.tzinfo,
+        )
+        obj.fmt = self.fmt
+        obj.ms_precision = self.ms_precision
+        obj.parse_method = method
+        obj.had_z = self.had_z
+
+        return obj
 
     def _derived_method(self) -> str:
         """Decide the parse_method when arithmetic changes the timestamp."""
@@ -334,20 +426,58 @@ class ParsedDatetime(datetime):
         if "%f" not in fmt:
             return super().strftime(fmt)
 
-        sentinel = "{__frac__}"
         ms_precision = _clamp_ms_precision(int(ms_precision if ms_precision is not None else 6))
-        out = super().strftime(fmt.replace("%f", sentinel))
-        frac = f"{self.microsecond:06d}"[:ms_precision]
 
-        return out.replace(sentinel, frac)
+        return _strftime_with_fraction(self, fmt, ms_precision)
 
 
 def infer_ms_precision(s: str) -> int:
     """Attempt to infer the precision of any microseconds in a date string.
     :param s: string"""
-    m = fraction_re.search(s)
+    # scan for the first '.' followed by a digit, counting at most 6 digits (the precision is clamped to 6 anyway);
+    # 'isdecimal' accepts the same characters as the regex '\d'
+    i = s.find(".")
+
+    while i >= 0:
+        n = 0
+
+        for char in s[i + 1 : i + 7]:
+            if not char.isdecimal():
+                break
+
+            n += 1
+
+        if n:
+            return n
+
+        i = s.find(".", i + 1)
+
+    return 0
+
+
+def parse_iso_fast(s: str) -> Optional[tuple[datetime, str]]:
+    """Parse the common ISO 8601 shapes ('YYYY-mm-dd', 'YYYY-mm-ddTHH:MM:SS' and 'YYYY-mm-ddTHH:MM:SS.ffffff', with
+    either 'T' or ' ' as the separator) with 'datetime.fromisoformat' instead of 'strptime'.
+    Returns a tuple of the datetime and the equivalent strptime format string, or None if the string is not one of
+    these shapes or is not a valid date. Expects 'Z' to already be stripped (see 'normalize_for_strptime').
+    :param s: string"""
+    m = iso_fast_ptn.fullmatch(s)
+
+    if m is None:
+        return None
 
-    return _clamp_ms_precision(len(m.group(1)) if m else 0)
+    # the regex only decides the format string; 'fromisoformat' does the (C implemented) parse and range checks
+    try:
+        parsed = datetime.fromisoformat(s)
+    except ValueError:
+        return None
+
+    sep, frac = m.group(4, 8)
+
+    if sep is None:
+        return (parsed, "%Y-%m-%d")
+
+    return (parsed, f"%Y-%m-%d{sep}%H:%M:%S.%f" if frac else f"%Y-%m-%d{sep}%H:%M:%S")
 
 
 def normalize_for_strptime(s: str) -> tuple[str, bool]:
@@ -387,24 +517,30 @@ def datetime_from_string(
         parsed = datetime.strptime(norm, fmt.removesuffix("Z"))
         return finalize(parsed, fmt, "manual")
 
+    # the default candidates are tried in the same order the fast path resolves formats, so the same format string is
+    # recorded; custom format sequences always go through 'strptime'
+    if formats is _DEFAULT_CANDIDATES:
+        fast = parse_iso_fast(norm)
+
+        if fast is not None:
+            return finalize(*fast, "iso")
+
     last_err: Optional[Exception] = None
     attempted_formats: list[str] = []
 
-    for fmt in formats:
+    candidates = _CANDIDATES_STRIPPED if formats is _DEFAULT_CANDIDATES else _strip_candidates(formats)
+
+    for fmt, stripped_fmt in candidates:
         try:
-            parsed = datetime.strptime(norm, fmt.removesuffix("Z"))
+            parsed = datetime.strptime(norm, stripped_fmt)
             return finalize(parsed, fmt, "strptime")
         except ValueError as e:
             if fmt not in attempted_formats:
                 attempted_formats.append(fmt)
             last_err = e
 
-    # last ditch pattern match
-    if iso_timestamp_ptn.match(dt):
-        return finalize(parsed, "%Y-%m-%dT%H:%M:%S.%f", "regex")
-
     formats_str = ", ".join(f"'{fmt}'" for fmt in attempted_formats)
-    err_msg = f"Could not parse datetime {dt!r} with either regex pattern match or datetime formats"
+    err_msg = f"Could not parse datetime {dt!r} with datetime formats"
     raise ValueError(f"{err_msg}: {formats_str}") from last_err
 
 
@@ -424,21 +560,45 @@ def parse_datetime_from_json_value(
                 is made to work out the correct format type
     :param ms_precision: if the datetime has microseconds, provide a level of precision that will be retained; minimum
                          is '0', maximum is '6'; default is '6'"""
-    fn = partial(parse_datetime_from_json_value, formats=formats, fmt=fmt, ms_precision=ms_precision)
+    # every default candidate starts with a 4 digit year, so anything else can be rejected without attempting a parse
+    quick_reject = fmt is None and formats is _DEFAULT_CANDIDATES
+
+    def convert(v: Any) -> Any:
+        if quick_reject and not v[:4].isdigit():
+            return v
 
-    if isinstance(obj, str):
         try:
-            return datetime_from_string(obj, formats=formats, fmt=fmt, ms_precision=ms_precision)
+            return datetime_from_string(v, formats=formats, fmt=fmt, ms_precision=ms_precision)
         except (ValueError, TypeError):
-            return obj
+            return v
 
-    if isinstance(obj, list):
-        return [fn(v) for v in obj]
+    if isinstance(obj, str):
+        return convert(obj)
 
-    if isinstance(obj, dict):
-        return {k: fn(v) for k, v in obj.items()}
+    if not isinstance(obj, (list, dict)):
+        return obj
 
-    return obj
+    # walk nested lists/dicts with a worklist of (source, result) containers; results are new containers, the source
+    # object is not modified
+    root: list[Any] | dict[Any, Any] = [None] * len(obj) if isinstance(obj, list) else {}
+    pending: list[tuple[Any, Any]] = [(obj, root)]
+
+    while pending:
+        src, dst = pending.pop()
+
+        for k, v in enumerate(src) if isinstance(src, list) else src.items():
+            if isinstance(v, str):
+                v = convert(v)
+            elif isinstance(v, list):
+                pending.append((v, child := [None] * len(v)))
+                v = child
+            elif isinstance(v, dict):
+                pending.append((v, child := {}))
+                v = child
+
+            dst[k] = v
+
+    return root
 
 
 def datetime_obj_hook(
@@ -465,14 +625,14 @@ def datetime_obj_hook(
     if not isinstance(obj, dict):
         return obj
 
-    formats = formats if formats is not None else DateTimeFormats.candidates
-    ms_precision = ms_precision if ms_precision is not None else DateTimeFormats.ms_precision
-    field_candidates = frozenset(
-        field_candidates if field_candidates is not None else DateTimeFormats.field_candidates
-    )
+    formats = formats if formats is not None else _DEFAULT_CANDIDATES
+    ms_precision = ms_precision if ms_precision is not None else _DEFAULT_MS_PRECISION
+    fields = _DEFAULT_FIELD_SET if field_candidates is None else _casefolded_set(tuple(field_candidates))
 
     for k, v in obj.items():
-        if k.casefold() in field_candidates:
+        # TASS keys are almost always lowercase already, so only casefold on a miss; a lowercase ASCII key is its own
+        # casefold, so a miss on one of those is final (the checks don't allocate, unlike 'casefold')
+        if k in fields or (not (k.isascii() and k.islower()) and k.casefold() in fields):
             obj[k] = parse_datetime_from_json_value(v, formats=formats, fmt=fmt, ms_precision=ms_precision)
 
     return obj
@@ -481,13 +641,18 @@ def datetime_obj_hook(
 def timestamp_now_as_str(fmt: Optional[str] = None) -> str:
     """Generate a timestamp as a string using 'datetime.now()'. Microseconds precision is capped to 3.
     :param fmt: optional datetime format string; defaults to '%Y-%m-%sT%H:%M:%S.%f' if not provided."""
-    fmt = DateTimeFormats.timestamp_fmt if fmt is None else fmt
-    return str(ParsedDatetime(datetime.now(), fmt=fmt, ms_precision=3))
+    now = datetime.now()
+
+    # the default format is built directly; milliseconds are the first 3 digits of the microseconds
+    if fmt is None or fmt == DateTimeFormats.timestamp_fmt:
+        return f"{now.isoformat(timespec='seconds')}.{now.microsecond // 1000:03d}"
+
+    return str(ParsedDatetime(now, fmt=fmt, ms_precision=3))
 
 
 def today_midnight_ts() -> str:
     """Generates a timestamp string that returns 'YYYY-mm-ddT00:00:00.000' (midnight)."""
-    return timestamp_now_as_str(fmt=DateTimeFormats.today_midnight_fmt)
+    return f"{date.today().isoformat()}T00:00:00.000"
 
 
 def today_as_str() -> str:
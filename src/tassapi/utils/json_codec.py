@@ -0,0 +1,20 @@
+import json
+
+from typing import Any
+
+try:
+    import orjson  # optional; significantly faster decoding of large payloads
+except ImportError:
+    orjson = None
+
+
+def json_loads(s: bytes | str) -> Any:
+    """Decode a JSON document. Uses 'orjson' when it is installed, otherwise falls back to the stdlib 'json' module.
+    Both raise a 'json.JSONDecodeError' (or subclass) on invalid JSON; bytes that aren't valid UTF-8 may raise a
+    'UnicodeDecodeError' instead. Either way the exception is a 'ValueError'.
+    :param s: JSON document as bytes (expected to be UTF-8) or string"""
+    if orjson is not None:
+        return orjson.loads(s)
+
+    return json.loads(s)
+
@@ -1,19 +1,21 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping
 from typing import Any
 
 
 def _escape_token(tkn: str) -> str:
     """RFC 6901 escaping"""
+    # almost no keys need escaping; the membership checks avoid copying the key twice
+    if "~" not in tkn and "/" not in tkn:
+        return tkn
+
     return tkn.replace("~", "~0").replace("/", "~1")
 
 
-def _join(p: str, k: str) -> str:
-    """Join path with key.
+def _materialize(p: str, segs: tuple[str, ...]) -> str:
+    """Join path with the (unescaped) key segments.
     :param p: path
-    :param k: key"""
-    k = _escape_token(k)
-
-    return f"{p}/{k}" if p else f"/{k}"
+    :param segs: tuple of keys"""
+    return p + "".join(f"/{_escape_token(s)}" for s in segs)
 
 
 def _json_diff(a: Any, b: Any, path: str = "") -> list[dict[str, Any]]:
@@ -22,48 +24,50 @@ def _json_diff(a: Any, b: Any, path: str = "") -> list[dict[str, Any]]:
     :param b: to object
     :param path: path"""
     ops: list[dict[str, Any]] = []
-
-    # no changes
-    if a == b:
-        return ops
-
-    # mapping vs mapping
-    if isinstance(a, Mapping) and isinstance(b, Mapping):
-        a_keys = set(a.keys())
-        b_keys = set(b.keys())
-
-        # removals
-        for k in sorted(a_keys - b_keys):
-            p = _join(path, str(k))
-            ops.append({"op": "test", "path": p, "value": a[k]})
-            ops.append({"op": "remove", "path": p})
-
-        # additions
-        for k in sorted(b_keys - a_keys):
-            p = _join(path, str(k))
-            ops.append({"op": "add", "path": p, "value": b[k]})
-
-        # recurse shared/common keys (between a/b)
-        for k in sorted(a_keys & b_keys):
-            ops.extend(_json_diff(a[k], b[k], path=_join(path, str(k))))
-
-        return ops
-
-    # sequences (list/tuples)
-    # skip strings/bytes/bytearrays because these are also sequences
-    if (
-        isinstance(a, Sequence)
-        and isinstance(b, Sequence)
-        and not isinstance(a, (str, bytes, bytearray))
-        and not isinstance(a, (str, bytes, bytearray))
-    ):
-        ops.append({"op": "test", "path": path or "", "value": a})
-        ops.append({"op": "replace", "path": path or "", "value": b})
-
-        return ops
-
-    # anything else, replace scalar/mismatched types
-    ops.append({"op": "test", "path": path or "", "value": a})
-    ops.append({"op": "replace", "path": path or "", "value": b})
+    # depth first (LIFO) so ops are emitted in the same order as a recursive walk; key paths are kept as segments and
+    # only escaped/joined when an op is created
+    stack: list[tuple[Any, Any, tuple[str, ...]]] = [(a, b, ())]
+
+    while stack:
+        a, b, segs = stack.pop()
+
+        # no changes
+        if a is b or a == b:
+            continue
+
+        # mapping vs mapping
+        if isinstance(a, Mapping) and isinstance(b, Mapping):
+            removed: list[Any] = []
+            added: list[Any] = []
+            common: list[Any] = []
+
+            for k in sorted(a.keys() | b.keys()):
+                if k not in b:
+                    removed.append(k)
+                elif k not in a:
+                    added.append(k)
+                else:
+                    common.append(k)
+
+            # removals
+            for k in removed:
+                p = _materialize(path, (*segs, str(k)))
+                ops.append({"op": "test", "path": p, "value": a[k]})
+                ops.append({"op": "remove", "path": p})
+
+            # additions
+            for k in added:
+                ops.append({"op": "add", "path": _materialize(path, (*segs, str(k))), "value": b[k]})
+
+            # shared/common keys (between a/b), pushed in reverse so they pop in sorted order
+            for k in reversed(common):
+                stack.append((a[k], b[k], (*segs, str(k))))
+
+            continue
+
+        # sequences (list/tuples) and anything else (scalar/mismatched types) are replaced whole
+        p = _materialize(path, segs)
+        ops.append({"op": "test", "path": p, "value": a})
+        ops.append({"op": "replace", "path": p, "value": b})
 
     return ops
@@ -1,7 +1,9 @@
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any, Optional
 
-from .models import PatchableDict
+from .datetime_utils import datetime_obj_hook
+from .json_codec import json_loads
+from .models import IMMUTABLE_TYPES, PatchableDict, _fast_clone
 from .json_patch_utils import _json_diff
 
 
@@ -16,8 +18,8 @@ def json_patch(from_obj: Any, to_obj: Any, *, path: str = "") -> list[dict[str,
 def parse_json_with_hooks(obj: Any, *, hooks: Optional[Sequence[Callable[[Any], Any]]] = None) -> Any:
     """Convert a 'requests.Response.json()' result into a 'PatchableDict' instance. Expects already decoded
     JSON data, not a JSON string.
-    Every mapping becomes a 'PatchableDict', hooks are applied to each mapping before recursion. Only the
-    returned root 'PatchableDict' is snapshotted by default (covers the whole tree).
+    Every mapping becomes a 'PatchableDict', hooks are applied to each mapping before recursion. Each
+    'PatchableDict' is snapshotted as it is built, sharing its children's snapshots, so the tree is cloned once.
     Returns the same shape as input but with 'dict' objects replaced by 'PatchableDict' objects.
     :param obj: parsed JSON
     :param hooks: a sequence of callables applied to each mapping (typically mutates in place)"""
@@ -28,22 +30,74 @@ def parse_json_with_hooks(obj: Any, *, hooks: Optional[Sequence[Callable[[Any],
             if callable(hook):
                 hook(d)
 
-    def _walk(x: Any) -> Any:
-        if isinstance(x, Mapping):
-            d = dict(x)
+    # containers created but not yet filled; (value, snapshot, items) where items are (key/index, child) pairs
+    pending: list[tuple[Any, Any, Iterable[tuple[Any, Any]]]] = []
+
+    def _node(x: Any) -> tuple[Any, Any]:
+        # returns the converted value and a snapshot clone of it; containers are returned empty and queued to be filled,
+        # the snapshot of each mapping is built from the snapshots of its children so every node is cloned once
+        t = type(x)
+
+        # scalars are the bulk of the nodes; immutable, so the value and snapshot can share them
+        if t in IMMUTABLE_TYPES:
+            return x, x
+
+        if t is list:
+            value, snapshot = [None] * len(x), [None] * len(x)
+            pending.append((value, snapshot, enumerate(x)))
+
+            return value, snapshot
+
+        # the 'isinstance' ABC check only runs for containers that aren't a plain dict/list
+        if t is dict or isinstance(x, Mapping):
+            # hooks mutate in place, so only copy the input mapping when there are hooks to apply
+            d = dict(x) if hooks else x
             _apply_hooks(d)
+            snapshot: dict[str, Any] = {}
+            value = PatchableDict._with_snapshot({}, snapshot)
+            # JSON keys are always strings, only re-key anything else
+            items = d.items() if all(type(k) is str for k in d) else [(str(k), v) for k, v in d.items()]
+            pending.append((value, snapshot, items))
+
+            return value, snapshot
+
+        if t is tuple:
+            pairs = [_node(v) for v in x]  # children are queued (not filled) so this doesn't recurse into them
+
+            return tuple(v for v, _ in pairs), tuple(s for _, s in pairs)
+
+        return x, _fast_clone(x)
+
+    root, _ = _node(obj)
+
+    # iterative, so deeply nested payloads don't hit the recursion limit
+    while pending:
+        value, snapshot, items = pending.pop()
+
+        for k, v in items:
+            value[k], snapshot[k] = _node(v)
+
+    return root
 
-            for k, v in list(d.items()):
-                d[str(k)] = _walk(v)
 
-            return PatchableDict(d)
+def parse_json_with_dates(payload: bytes | str, *, field_candidates: Optional[Sequence[str]] = None) -> Any:
+    """Decode a JSON document and convert the values of datetime fields into 'ParsedDatetime' objects in a single pass
+    over the decoded data. Unlike 'parse_json_with_hooks' the result is plain 'dict'/'list' objects (no snapshots),
+    for read only use. Decoding uses 'orjson' when it is installed.
+    :param payload: JSON document as bytes (expected to be UTF-8) or string
+    :param field_candidates: optional sequence of fieldnames that are candidates for converting string value to
+                             'ParsedDatetime' object; defaults to 'DateTimeFormats.field_candidates'"""
+    data = json_loads(payload)
+    # the decoded data is owned here, so the hook can mutate each object in place
+    pending: list[Any] = [data] if type(data) is dict or type(data) is list else []
 
-        if isinstance(x, list):
-            return [_walk(v) for v in x]
+    while pending:
+        x = pending.pop()
 
-        if isinstance(x, tuple):
-            return tuple(_walk(v) for v in x)
+        if type(x) is dict:
+            datetime_obj_hook(x, field_candidates=field_candidates)
+            x = x.values()
 
-        return x
+        pending.extend(v for v in x if type(v) is dict or type(v) is list)
 
-    return _walk(obj)
+    return data
@@ -1,6 +1,7 @@
 import copy
 import json
 
+from datetime import date, datetime, time
 from typing import Any
 
 from .json_patch_utils import _json_diff
@@ -11,6 +12,31 @@ __all__ = [
     "PatchableDict",
 ]
 
+# types that are never mutated in place, so a snapshot can share them rather than copy them
+IMMUTABLE_TYPES = frozenset((str, int, float, bool, type(None), bytes, date, datetime, time, ParsedDatetime))
+
+
+def _fast_clone(x: Any) -> Any:
+    """Clone JSON shaped data (dicts, lists, tuples, and immutable scalars) for a snapshot. Dispatches on the exact type
+    instead of going through 'copy.deepcopy' (memo bookkeeping and '__reduce_ex__' per node); any other type still
+    falls back to 'copy.deepcopy'. Dictionaries (including 'PatchableDict') are cloned as plain dictionaries.
+    :param x: object to clone"""
+    t = type(x)
+
+    if t is dict or t is PatchableDict:
+        return {k: _fast_clone(v) for k, v in x.items()}
+
+    if t is list:
+        return [_fast_clone(v) for v in x]
+
+    if t in IMMUTABLE_TYPES:
+        return x
+
+    if t is tuple:
+        return tuple(_fast_clone(v) for v in x)
+
+    return copy.deepcopy(x)
+
 
 class PatchableDict(dict):
     """Basic dictionary subclass. Convenience wrapper to extend 'dict' functionality with JSON patch ops data
@@ -29,7 +55,19 @@ class PatchableDict(dict):
         super().__init__(*args, **kwargs)
 
         # create a snapshot of self that is not an instance of 'PatchableDict'; this is used for comparing to self
-        self._snapshot: dict[str, Any] = copy.deepcopy(dict(self))
+        self._snapshot: dict[str, Any] = _fast_clone(dict(self))
+
+    @classmethod
+    def _with_snapshot(cls, data: dict[str, Any], snapshot: dict[str, Any]) -> "PatchableDict":
+        """Create an instance from data with an already built snapshot of that data, skipping the clone made at init.
+        The snapshot must not share any mutable objects with 'data'.
+        :param data: dictionary data
+        :param snapshot: snapshot of 'data'"""
+        obj = cls.__new__(cls)
+        dict.update(obj, data)
+        obj._snapshot = snapshot
+
+        return obj
 
     def as_json(self) -> str:
         """Representation of the dictionary object as JSON."""
@@ -45,8 +83,9 @@ class PatchableDict(dict):
                          overriding this without providing a hook to convert 'ParsedDatetime' to string will cause
                          errors"""
         kwargs.setdefault("default", str)
+
         return json.dumps(self.as_json_patch(_path=_path), **kwargs)
 
     def update_snapshot(self) -> None:
         """Update the snapshot to the current version of self."""
-        self._snapshot = copy.deepcopy(dict(self))
+        self._snapshot = _fast_clone(dict(self))
@@ -2,16 +2,41 @@ import platform
 import posixpath
 import re
 
-from base64 import b64decode
+from binascii import a2b_base64
 from email.message import Message
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Optional
-from urllib.parse import quote, unquote, urlparse, urlunparse
+from urllib.parse import ParseResult, quote, unquote, urlparse, urlunparse
 
 import requests
 
+from .validation_utils import new_hash
 
-def build_user_agent(name: str, *, version: str):
-    """Build a user agent string.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# error_attrs = ("status", "title", "detail", "errors", "message")
+ERROR_ATTRS = ("title", "detail", "errors", "message")
+ERROR_ATTRS_SET = frozenset(ERROR_ATTRS)
+EMPTY_ERROR_DATA = dict.fromkeys(ERROR_ATTRS)
+
+multi_slash_ptn = re.compile(r"/{2,}")
+# characters 'quote' never encodes (unreserved characters and its default safe '/')
+unreserved_path_ptn = re.compile(r"[A-Za-z0-9._~/-]+", re.ASCII)
+URL_PATH_STRIP_CHARS = "/ \n\r\t"
+
+
+@lru_cache(maxsize=32)
+def _parse_base_url(base: str) -> ParseResult:
+    """Parse a base url, cached; the same few base urls are joined to on every request.
+    :param base: base of the url; for example: 'https://example.org/api/v1'"""
+    return urlparse(base)
+
+
+@lru_cache(maxsize=8)
+def build_user_agent(name: str, *, version: str) -> str:
+    """Build a user agent string, cached; the platform details are constant for the life of the process and some
+    'platform' calls can be slow (shelling out on some operating systems).
     :param name: intended name of the user-agent, for example 'tassapi-ua'
     :param version: version of the user-agent, for example '1.0.0'"""
     python_info: tuple[Optional[str], Optional[str]] = (platform.python_implementation(), platform.python_version())
@@ -22,21 +47,61 @@ def build_user_agent(name: str, *, version: str):
     return f"{name}/{version} {py_extras} {os_extras}"
 
 
+@lru_cache(maxsize=32)
+def _normalized_base_url(base: str) -> Optional[str]:
+    """Return the base url when it is already in the normalized form 'urljoin' produces (which endpoint urls are), so
+    path segments can be appended to it directly, otherwise None.
+    :param base: base of the url; for example: 'https://example.org/api/v1'"""
+    parsed_base = _parse_base_url(base)
+
+    if parsed_base.params or parsed_base.query or parsed_base.fragment:
+        return None
+
+    return base if _urljoin(base) == base else None
+
+
+def _has_dot_segment(path: str) -> bool:
+    """Test if a path contains any '.' or '..' segments.
+    :param path: path string, for example 'students/../employees'"""
+    return "." in path and any(seg in (".", "..") for seg in path.split("/"))
+
+
+def _quote_path(path: Any) -> str:
+    """Strip surrounding '/' and whitespace from a path value and quote it; values that 'quote' wouldn't change (codes
+    are typically plain alphanumeric) skip quoting.
+    :param path: path value, for example 'students' or a student code"""
+    path = str(path).strip(URL_PATH_STRIP_CHARS)
+    return path if unreserved_path_ptn.fullmatch(path) else quote(path)
+
+
 def urljoin(base: str, *paths) -> str:
     """A custom implementation of urljoin that parses a URL into component parts, joins paths to any path
     value from the base path, normalizes the path value so any redundant '/' characters are removed, then
     rejoins the url together into a new url.
     :param base: base of the url; for example: 'https://example.org/api/v1'
     :param *paths: additional values to be used as paths, for example 'users', 'information'"""
-    parsed_base = urlparse(base)
-    safe_paths = [quote(str(p).strip("/ \n\r\t")) for p in paths if p]
+    safe_paths = [_quote_path(p) for p in paths if p]
+    normalized_base = _normalized_base_url(base)
+
+    # the common case (a normalized base and plain path segments) needs no parsing or normalizing, just joining
+    if normalized_base is not None and not any(not p or "//" in p or _has_dot_segment(p) for p in safe_paths):
+        return "/".join((normalized_base, *safe_paths))
+
+    return _urljoin(base, *safe_paths)
+
+
+def _urljoin(base: str, *safe_paths: str) -> str:
+    """Join already quoted paths to a base url, normalizing the path of the resulting url.
+    :param base: base of the url; for example: 'https://example.org/api/v1'
+    :param *safe_paths: quoted path strings"""
+    parsed_base = _parse_base_url(base)
     combined_path = posixpath.join(parsed_base.path, *safe_paths)
     combined_path = posixpath.normpath(combined_path)  # normalize '..' and '.'
 
     if not combined_path.startswith("/"):
         combined_path = f"/{combined_path}"
 
-    combined_path = re.sub(r"/{2,}", "/", combined_path)  # normalize two or more '/' to single '/'
+    combined_path = multi_slash_ptn.sub("/", combined_path)  # normalize two or more '/' to single '/'
 
     if combined_path.endswith("/"):
         combined_path = combined_path.rstrip("/")
@@ -48,18 +113,16 @@ def urljoin(base: str, *paths) -> str:
 
 def parse_response_error_data(r: requests.Response) -> Optional[dict[str, Any]]:
     """Parse any response data returned by the API and return a dictionary of values."""
-    # error_attrs = ("status", "title", "detail", "errors", "message")
-    error_attrs = ("title", "detail", "errors", "message")
-
     try:
         err_data = r.json()
     except Exception:
         return None
 
-    if not err_data:
+    if not err_data or not isinstance(err_data, dict):
         return None
 
-    return {attr: err_data.get(attr, None) for attr in error_attrs}
+    # every attribute is present in the result (None when missing); only the attributes present are looked up
+    return {**EMPTY_ERROR_DATA, **{attr: err_data[attr] for attr in ERROR_ATTRS_SET & err_data.keys()}}
 
 
 def parse_digest_data_from_response(r: requests.Response) -> Optional[tuple[str, str]]:
@@ -72,11 +135,41 @@ def parse_digest_data_from_response(r: requests.Response) -> Optional[tuple[str,
         return (None, None)
 
     digest_type, digest_value = digest.split("=", 1)
-    digest_value = b64decode(digest_value).hex()
+    digest_value = a2b_base64(digest_value).hex()
 
     return (digest_type, digest_value)
 
 
+def stream_to_file_with_digest(
+    r: requests.Response,
+    fp: Path,
+    *,
+    digest_type: Optional[str] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Optional[str]:
+    """Write the response content to a file, hashing each chunk as it is written so the file never has to be read
+    back to validate it. Returns the hex digest of the content, or None when no 'digest_type' is provided.
+    Works for both streamed responses and responses whose content has already been read; connection errors part way
+    through the body raise 'requests' exceptions (for example 'ChunkedEncodingError').
+    :param r: response object
+    :param fp: file path the content is written to
+    :param digest_type: optional digest type to hash the content with; for example 'SHA-256'
+    :param chunk_size: the number of bytes written (and hashed) at a time; default is 1 MiB"""
+    h = new_hash(digest_type) if digest_type else None
+    update = h.update if h is not None else None
+
+    with fp.open("wb", buffering=chunk_size) as f:
+        # 'iter_content' (rather than reading 'r.raw' directly) wraps urllib3 errors in 'requests' exceptions and
+        # replays the content when it was already consumed
+        for chunk in r.iter_content(chunk_size=chunk_size):
+            f.write(chunk)
+
+            if update is not None:
+                update(chunk)
+
+    return h.hexdigest() if h is not None else None
+
+
 def parse_filename_from_response(r: requests.Response) -> Optional[str]:
     """Parse the remote filename from header data from the response object.
     :param r: response object"""
@@ -119,7 +212,14 @@ def merge_odata_filter_param(fltr: str, *, kwargs: dict[str, Any]) -> dict[str,
     """Merge an OData filter string into existing params.
     :param fltr: OData filter string, for example 'doe ge {date} or dol eq null or dol ge {date}'
     :param kwargs: dictionary of params"""
-    params = dict(kwargs.get("params", {}))
+    exst_params = kwargs.get("params")
+
+    # nothing to merge with, so there's no need to copy anything
+    if not exst_params:
+        kwargs["params"] = {"$filter": fltr}
+        return kwargs
+
+    params = dict(exst_params)  # copy, the caller's params are not modified
     exst_fltr = params.get("$filter", "").strip()
     params["$filter"] = f"({exst_fltr}) and ({fltr})" if exst_fltr else fltr
     kwargs["params"] = params
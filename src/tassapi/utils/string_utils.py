@@ -8,13 +8,12 @@ def oxford_join(joiner: str, *args, sep: Optional[str] = None, quote_args: Optio
     :param sep: the join character, for example ','; defaults to ',' - a space is added"""
     sep = sep.strip() if sep is not None else ","
     joiner = joiner or "and"
-    new_args = [f"'{arg}'" for arg in args] if quote_args else args
 
-    if len(args) > 1:
-        first_str = f"{sep} ".join(new_args[:-1])
-        and_str = f" {joiner} " if len(new_args) == 2 else f", {joiner} "
-        last_str = new_args[-1]
+    if len(args) <= 1:
+        return "".join(f"'{arg}'" if quote_args else str(arg) for arg in args)
 
-        return f"{first_str}{and_str}{last_str}"
-    else:
-        return "".join(f"'{arg}'" for arg in args)
+    first_str = f"{sep} ".join(f"'{arg}'" if quote_args else str(arg) for arg in args[:-1])
+    and_str = f" {joiner} " if len(args) == 2 else f", {joiner} "
+    last_str = f"'{args[-1]}'" if quote_args else str(args[-1])
+
+    return f"{first_str}{and_str}{last_str}"
@@ -6,19 +6,63 @@ from typing import Any, Optional
 
 from .string_utils import oxford_join
 
+DIGEST_CHUNK_SIZE = 1024 * 1024
 
-def raise_for_digest_error(fp: Path, *, digest_type: str, digest_value: str, chunk_size: int = 8192) -> None:
+# digest types as they appear in the 'Digest' header (casefolded) mapped to hashlib constructors
+HASH_CONSTRUCTORS = {
+    "md5": hashlib.md5,
+    "sha": hashlib.sha1,
+    "sha-1": hashlib.sha1,
+    "sha1": hashlib.sha1,
+    "sha-256": hashlib.sha256,
+    "sha256": hashlib.sha256,
+    "sha-384": hashlib.sha384,
+    "sha384": hashlib.sha384,
+    "sha-512": hashlib.sha512,
+    "sha512": hashlib.sha512,
+}
+
+
+def new_hash(digest_type: str) -> "hashlib._Hash":
+    """Return a new hash object for a digest type, using the hashlib constructor directly for common digest types
+    rather than the name lookup in 'hashlib.new'. Unknown digest types fall back to 'hashlib.new'.
+    :param digest_type: the digest type; for example 'SHA-256'"""
+    ctor = HASH_CONSTRUCTORS.get(digest_type.casefold())
+    return ctor() if ctor is not None else hashlib.new(digest_type)
+
+
+def raise_for_digest_error(
+    fp: Path,
+    *,
+    digest_type: str,
+    digest_value: str,
+    chunk_size: int = DIGEST_CHUNK_SIZE,
+) -> None:
     """Validate the digest of a downloaded file. Raises a ValueError exception if the digests do not match.
     :param fp: file path
     :param digest_type: the digest type; for example 'SHA-256'
-    :param digest_value: the expected digest value"""
-    h = hashlib.new(digest_type)
+    :param digest_value: the expected digest value
+    :param chunk_size: the number of bytes read (and hashed) at a time; default is 1 MiB"""
+    h = new_hash(digest_type)
 
-    with fp.open("rb") as f:
-        while chunk := f.read(chunk_size):
-            h.update(chunk)
+    # read into one reusable buffer instead of allocating a new bytes object per chunk
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
 
-    actual_digest = h.hexdigest().casefold()
+    with fp.open("rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            h.update(view[:n])
+
+    raise_for_digest_mismatch(fp, actual_digest=h.hexdigest(), digest_value=digest_value)
+
+
+def raise_for_digest_mismatch(fp: Path, *, actual_digest: str, digest_value: str) -> None:
+    """Compare an already computed digest of a file against the expected digest. Raises a ValueError exception if the
+    digests do not match.
+    :param fp: file path (used in the exception message)
+    :param actual_digest: the hex digest value computed from the file content
+    :param digest_value: the expected digest value"""
+    actual_digest = actual_digest.casefold()
     target_digest = digest_value.casefold()
 
     if not actual_digest == target_digest:
@@ -27,14 +71,23 @@ def raise_for_digest_error(fp: Path, *, digest_type: str, digest_value: str, chu
         )
 
 
-def raise_for_reqd_attrs(obj: dict[str, Any], *, reqd_attrs: Sequence[str], param_name: Optional[str] = None) -> None:
+def raise_for_reqd_attrs(
+    obj: dict[str, Any],
+    *,
+    reqd_attrs: Sequence[str] | frozenset[str],
+    param_name: Optional[str] = None,
+) -> None:
     """Raise a ValueError exception when required attributes are missing from an object.
     :param obj: dictionary object
     :param param_name: paramter name to include in the exception
-    :param reqd_attrs: required attributes that should exist in 'obj'"""
-    missing_attrs = tuple(k for k in reqd_attrs if k not in obj.keys())
+    :param reqd_attrs: required attributes that should exist in 'obj'; a frozenset can be provided for attributes
+                       that are validated repeatedly (missing attributes are then listed in sorted order)"""
+    is_set = isinstance(reqd_attrs, frozenset)
+    missing = (reqd_attrs if is_set else frozenset(reqd_attrs)) - obj.keys()  # set difference; nothing missing is usual
 
-    if missing_attrs:
+    if missing:
+        # keep the order the attributes were given in; sort when they were given as a set
+        missing_attrs = tuple(sorted(missing)) if is_set else tuple(k for k in reqd_attrs if k in missing)
         attr_str = oxford_join("and", *missing_attrs)
         param_name = f"{param_name!r}" if param_name else ''
         err_msg = f"{param_name} is missing required attribute{'s' if len(missing_attrs) > 1 else ''}: {attr_str}"
@@ -0,0 +1,6 @@
+import sys
+
+from pathlib import Path
+
+# the package isn't installed for tests; import it from the source tree
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
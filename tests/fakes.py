@@ -0,0 +1,36 @@
+import json
+
+from types import SimpleNamespace
+from typing import Any
+
+import requests
+
+from tassapi.api.response import APIResponse
+
+
+def fake_session(base: str = "https://tass.example.org/api", cmpy_code: str = "10") -> SimpleNamespace:
+    """Minimal stand in for 'APISession'; already authenticated, so no requests are made to authenticate."""
+    server = SimpleNamespace(base=base, cmpy_code=cmpy_code)
+
+    return SimpleNamespace(authenticated=True, ensure_authenticated=lambda **kwargs: None, server=server)
+
+
+def json_response(payload: Any, *, url: str = "https://tass.example.org/api/10/x") -> APIResponse:
+    """Build an 'APIResponse' wrapping a 'requests.Response' with a JSON body, without any network access."""
+    r = requests.Response()
+    r.status_code = 200
+    r.headers["content-type"] = "application/json"
+    r.encoding = "utf-8"
+    r.url = url
+    r._content = json.dumps(payload).encode()
+
+    return APIResponse(r)
+
+
+def records_page(records: list[Any], params: dict[str, Any]) -> APIResponse:
+    """Page of 'records' selected by the OData '$top'/'$skip' params, as a paginated endpoint would return it."""
+    top, skip = int(params["$top"]), int(params["$skip"])
+
+    url = f"https://tass.example.org/api/10/x?%24top={top}&%24skip={skip}"
+
+    return json_response(records[skip:skip + top], url=url)
@@ -0,0 +1,119 @@
+import unittest
+
+from unittest import mock
+
+from fakes import fake_session, json_response
+
+from tassapi.endpoints.base import EndpointBase, endpoint_cache_key
+from tassapi.endpoints.options.students import StudentCommunicationRulesOptions
+from tassapi.utils.cache_utils import ttl_lru_cache
+
+
+class CountingEndpoint(EndpointBase):
+    __slots__ = ("calls",)
+
+    def __init__(self, session, endpoint="options") -> None:
+        super().__init__(session, endpoint=endpoint)
+        self.calls = 0
+
+    @ttl_lru_cache(maxsize=2, ttl=10.0, key=endpoint_cache_key, copy=lambda resp: resp.copy())
+    def lookup(self):
+        self.calls += 1
+        return json_response([{"code": "A", "calls": self.calls}])
+
+
+class FakeRulesOptions(StudentCommunicationRulesOptions):
+    __slots__ = ("calls",)
+
+    def _get(self, *args, **kwargs):
+        self.calls = getattr(self, "calls", 0) + 1
+        return json_response([{"code": "F"}, {"code": "M"}])
+
+
+class TTLLRUCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        CountingEndpoint.lookup.cache_clear()
+        patcher = mock.patch("tassapi.utils.cache_utils.time.monotonic", return_value=1000.0)
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_within_ttl(self):
+        ep = CountingEndpoint(fake_session())
+        ep.lookup()
+        self.clock.return_value = 1009.0
+        ep.lookup()
+
+        self.assertEqual(ep.calls, 1)
+
+    def test_expires_after_ttl(self):
+        ep = CountingEndpoint(fake_session())
+        ep.lookup()
+        self.clock.return_value = 1010.0
+
+        self.assertEqual(ep.lookup().data[0]["calls"], 2)
+        self.assertEqual(ep.calls, 2)
+
+    def test_least_recently_used_evicted(self):
+        a, b, c = (CountingEndpoint(fake_session(), endpoint=name) for name in ("a", "b", "c"))
+        a.lookup()
+        b.lookup()
+        a.lookup()  # 'b' is now the least recently used
+        c.lookup()  # evicts 'b'
+        a.lookup()
+        b.lookup()
+
+        self.assertEqual((a.calls, b.calls, c.calls), (1, 2, 1))
+
+    def test_instances_for_same_resource_share_results(self):
+        first, second = CountingEndpoint(fake_session()), CountingEndpoint(fake_session())
+        first.lookup()
+        second.lookup()
+
+        self.assertEqual((first.calls, second.calls), (1, 0))
+
+    def test_separate_keys_per_server_and_company(self):
+        endpoints = [
+            CountingEndpoint(fake_session()),
+            CountingEndpoint(fake_session(base="https://other.example.org/api")),
+            CountingEndpoint(fake_session(cmpy_code="20")),
+        ]
+
+        for ep in endpoints:
+            ep.lookup()
+
+        # maxsize is 2, so check the per-key misses rather than re-reading evicted entries
+        self.assertEqual([ep.calls for ep in endpoints], [1, 1, 1])
+
+    def test_callers_get_independent_data(self):
+        ep = CountingEndpoint(fake_session())
+        first = ep.lookup()
+        first.data[0]["code"] = "changed"
+        first.data.append({"code": "B"})
+        second = ep.lookup()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.data, [{"code": "A", "calls": 1}])
+
+    def test_options_cache_returns_independent_responses(self):
+        FakeRulesOptions.genders.cache_clear()
+        self.addCleanup(FakeRulesOptions.genders.cache_clear)
+        ep = FakeRulesOptions(fake_session(), "students")
+        first = ep.genders()
+        first.data.sort(key=lambda d: d["code"], reverse=True)
+        first.data[0]["code"] = "X"
+        second = FakeRulesOptions(fake_session(), "students").genders()
+
+        self.assertEqual(ep.calls, 1)
+        self.assertEqual([d["code"] for d in second.data], ["F", "M"])
+
+    def test_cache_clear(self):
+        ep = CountingEndpoint(fake_session())
+        ep.lookup()
+        CountingEndpoint.lookup.cache_clear()
+        ep.lookup()
+
+        self.assertEqual(ep.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import base64
+import hashlib
+import io
+import tempfile
+import unittest
+
+from pathlib import Path
+
+import requests
+
+from fakes import fake_session
+
+from tassapi.api.response import APIResponse
+from tassapi.endpoints.base import EndpointBase
+
+BODY = b"0123456789" * 1000
+
+
+class BrokenStream(io.BytesIO):
+    """Raw body that fails part way through, as a dropped connection would."""
+
+    def read(self, size=-1):
+        if self.tell() >= len(BODY) // 2:
+            raise OSError("connection dropped")
+
+        return super().read(size)
+
+
+def file_response(raw: io.BytesIO, *, digest: bytes = BODY, disposition: str = 'attachment; filename="scan.pdf"'):
+    r = requests.Response()
+    r.status_code = 200
+    r.url = "https://tass.example.org/api/10/x/attachments/1"
+    r.raw = raw
+
+    if disposition:
+        r.headers["content-disposition"] = disposition
+
+    r.headers["Digest"] = "SHA-256=" + base64.b64encode(hashlib.sha256(digest).digest()).decode()
+
+    return APIResponse(r)
+
+
+class FakeDownloadEndpoint(EndpointBase):
+    def __init__(self, response: APIResponse) -> None:
+        super().__init__(fake_session(), endpoint="x")
+        self.response = response
+
+    def _get(self, *args, **kwargs):
+        return self.response
+
+
+class DownloadTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dest = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def download(self, response: APIResponse, **kwargs):
+        return FakeDownloadEndpoint(response).download(dest=self.dest, chunk_size=1024, **kwargs)
+
+    def test_download_written_to_destination(self):
+        _, fn = self.download(file_response(io.BytesIO(BODY)))
+
+        self.assertEqual(fn, self.dest / "scan.pdf")
+        self.assertEqual(fn.read_bytes(), BODY)
+        self.assertEqual([p.name for p in self.dest.iterdir()], ["scan.pdf"])
+
+    def test_failed_download_leaves_no_file(self):
+        for unique in (False, True):
+            with self.subTest(unique=unique), self.assertRaises(OSError):
+                self.download(file_response(BrokenStream(BODY)), unique=unique)
+
+            self.assertEqual(list(self.dest.iterdir()), [])
+
+    def test_failed_download_keeps_existing_file(self):
+        (self.dest / "scan.pdf").write_bytes(b"previous")
+
+        with self.assertRaises(OSError):
+            self.download(file_response(BrokenStream(BODY)))
+
+        self.assertEqual((self.dest / "scan.pdf").read_bytes(), b"previous")
+        self.assertEqual(len(list(self.dest.iterdir())), 1)
+
+    def test_digest_mismatch_leaves_no_file(self):
+        for unique in (False, True):
+            with self.subTest(unique=unique), self.assertRaises(ValueError):
+                self.download(file_response(io.BytesIO(BODY), digest=b"other"), unique=unique)
+
+            self.assertEqual(list(self.dest.iterdir()), [])
+
+    def test_unique_download_does_not_overwrite(self):
+        (self.dest / "scan.pdf").write_bytes(b"previous")
+        _, fn = self.download(file_response(io.BytesIO(BODY)), unique=True)
+
+        self.assertEqual(fn.name, "scan (1).pdf")
+        self.assertEqual(fn.read_bytes(), BODY)
+        self.assertEqual((self.dest / "scan.pdf").read_bytes(), b"previous")
+
+    def test_body_read_when_no_file_stream(self):
+        resp = file_response(io.BytesIO(b'{"message": "not found"}'), disposition="")
+        _, fn = self.download(resp)
+
+        self.assertIsNone(fn)
+        self.assertTrue(resp.r._content_consumed)
+
+
+if __name__ == "__main__":
+    unittest.main()
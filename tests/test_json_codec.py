@@ -0,0 +1,45 @@
+import json
+import unittest
+
+from unittest import mock
+
+from tassapi.utils import json_codec
+from tassapi.utils.datetime_utils import DateTimeFormats, datetime_from_string
+from tassapi.utils.models import PatchableDict
+
+
+def sample() -> dict:
+    dt = datetime_from_string("2026-01-02T03:04:05.123Z", formats=DateTimeFormats.candidates)
+    return {"a": 1, "b": [1.5, None, True], "c": "é/x", "d": dt, "e": {"nested": "value"}}
+
+
+class JSONCodecTests(unittest.TestCase):
+    def test_loads_with_and_without_orjson(self):
+        doc = b'{"a": [1, "\\u00e9", null]}'
+        with_orjson = json_codec.json_loads(doc)
+
+        with mock.patch.object(json_codec, "orjson", None):
+            without_orjson = json_codec.json_loads(doc)
+
+        self.assertEqual(with_orjson, without_orjson)
+        self.assertEqual(without_orjson, {"a": [1, "é", None]})
+
+    def test_patchable_dict_output_uses_stdlib_format(self):
+        p = PatchableDict(sample())
+        p["a"] = 2
+        p["c"] = "ü"
+
+        self.assertEqual(p.as_json(), json.dumps(p, default=str))
+        self.assertIn('"d": "2026-01-02T03:04:05.123Z"', p.as_json())
+        self.assertEqual(p.as_patch_str(), json.dumps(p.as_json_patch(), default=str))
+        self.assertIn("\\u00fc", p.as_patch_str())
+        self.assertEqual(p.as_patch_str(indent=2), json.dumps(p.as_json_patch(), default=str, indent=2))
+
+    def test_patch_str_keeps_non_finite_floats(self):
+        p = PatchableDict({"a": 1.0})
+        p["a"] = float("nan")
+
+        self.assertIn("NaN", p.as_patch_str())
+
+if __name__ == "__main__":
+    unittest.main()
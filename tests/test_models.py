@@ -0,0 +1,27 @@
+import importlib
+import mimetypes
+import unittest
+
+from tassapi.api import models
+from tassapi.api.models import FileUpload
+
+
+class MimeTypeTests(unittest.TestCase):
+    def test_import_keeps_registered_types(self):
+        mimetypes.add_type("application/x-tass-test", ".tasstest")
+        importlib.reload(models)
+
+        self.assertEqual(mimetypes.guess_type("file.tasstest")[0], "application/x-tass-test")
+
+    def test_unknown_suffix_not_cached(self):
+        self.assertEqual(FileUpload("a.tassnew").mime_type, "application/octet-stream")
+
+        mimetypes.add_type("application/x-tass-new", ".tassnew")
+        self.assertEqual(FileUpload("b.tassnew").mime_type, "application/x-tass-new")
+
+    def test_known_suffix(self):
+        self.assertEqual(FileUpload("scan.PDF").mime_type, "application/pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
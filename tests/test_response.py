@@ -0,0 +1,54 @@
+import unittest
+
+from unittest import mock
+
+import requests
+
+from tassapi.api.response import APIResponse
+from tassapi.utils import json_codec
+
+
+def raw_response(content: bytes, *, encoding: str | None = "utf-8") -> APIResponse:
+    r = requests.Response()
+    r.status_code = 200
+    r.headers["content-type"] = "application/json"
+    r.encoding = encoding
+    r.url = "https://tass.example.org/api/10/x"
+    r._content = content
+
+    return APIResponse(r)
+
+
+class DecodeJSONTests(unittest.TestCase):
+    def assert_decodes_like_requests(self, content: bytes) -> None:
+        resp = raw_response(content)
+        self.assertEqual(resp.json(), resp.r.json())
+        self.assertEqual(raw_response(content).data, resp.r.json())
+
+    def assert_raises_requests_error(self, content: bytes) -> None:
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            raw_response(content).json()
+
+    def test_invalid_utf8_decoded_leniently_with_orjson(self):
+        self.assert_decodes_like_requests(b'{"a": "\xff"}')
+
+    def test_invalid_utf8_decoded_leniently_without_orjson(self):
+        with mock.patch.object(json_codec, "orjson", None):
+            self.assert_decodes_like_requests(b'{"a": "\xff"}')
+
+    def test_invalid_json_raises_requests_error_with_orjson(self):
+        self.assert_raises_requests_error(b'{"a": ')
+        self.assert_raises_requests_error(b"")
+
+    def test_invalid_json_raises_requests_error_without_orjson(self):
+        with mock.patch.object(json_codec, "orjson", None):
+            self.assert_raises_requests_error(b'{"a": ')
+            self.assert_raises_requests_error(b"")
+
+    def test_declared_non_utf8_encoding(self):
+        resp = raw_response('{"a": "é"}'.encode("latin-1"), encoding="iso-8859-1")
+        self.assertEqual(resp.json(), {"a": "é"})
+
+
+if __name__ == "__main__":
+    unittest.main()
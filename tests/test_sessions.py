@@ -0,0 +1,76 @@
+import dataclasses
+import threading
+import time
+import unittest
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from tassapi.api.sessions import APISession, TassAPIServer
+
+
+class CountingSession(APISession):
+    """Session whose authentication request is stubbed; counts the authentication requests made."""
+
+    def __init__(self) -> None:
+        server = TassAPIServer(
+            base="https://tass.example.org/api", key="k", secret="s", cmpy_code="10", attachment_dest=Path(".")
+        )
+        super().__init__(server)
+        self.auth_requests = 0
+        self.count_lock = threading.Lock()
+
+    def _auth_payload(self) -> dict:
+        return {}
+
+    def post(self, url, **kwargs):
+        with self.count_lock:
+            self.auth_requests += 1
+
+        time.sleep(0.05)  # other threads find the token expired while this request is in flight
+        expiry = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        token = {"token": "t", "token_expiry_date": expiry, "allowed_companies": [{"cmpy_code": "10"}]}
+
+        return SimpleNamespace(json=lambda: token)
+
+
+class TassAPIServerTests(unittest.TestCase):
+    def test_retry_adapter_not_a_field(self):
+        server = CountingSession().server
+
+        self.assertNotIn("_retry_adapter", [f.name for f in dataclasses.fields(server)])
+        self.assertNotIn("_retry_adapter", dataclasses.asdict(server))
+        self.assertIs(server.retry_adapter, server.retry_adapter)
+        self.assertEqual(server.retry_adapter.total, 5)
+        self.assertEqual(dataclasses.replace(server, retries=2).retry_adapter.total, 2)
+
+
+class AuthenticationTests(unittest.TestCase):
+    def test_expired_token_renewed_once_across_threads(self):
+        session = CountingSession()
+        session.ensure_authenticated()
+        session._metadata["expires_at"] = 0.0  # token expires while requests are in flight
+
+        threads = [threading.Thread(target=session.ensure_authenticated) for _ in range(8)]
+
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(session.auth_requests, 2)
+        self.assertTrue(session.authenticated)
+        self.assertTrue(session.valid_company_code)
+
+    def test_authenticated_session_not_renewed(self):
+        session = CountingSession()
+        session.ensure_authenticated()
+        session.ensure_authenticated()
+
+        self.assertEqual(session.auth_requests, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
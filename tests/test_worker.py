@@ -0,0 +1,135 @@
+import threading
+import time
+import unittest
+
+import requests
+
+from fakes import fake_session, records_page
+
+from tassapi.endpoints.base import EndpointBase
+
+
+class FakeEndpoint(EndpointBase):
+    """Paginated endpoint serving 'records' with a stubbed '_get'; 'before_get' runs on the worker thread first."""
+
+    def __init__(self, records, before_get=None) -> None:
+        super().__init__(fake_session(), endpoint="x")
+        self.records = records
+        self.before_get = before_get
+        self.requested_skips = []
+        self.lock = threading.Lock()
+
+    def _get(self, *args, params=None, **kwargs):
+        skip = int(params["$skip"])
+
+        with self.lock:
+            self.requested_skips.append(skip)
+
+        if self.before_get is not None:
+            self.before_get(skip)
+
+        return records_page(self.records, params)
+
+
+def ids(data) -> list[int]:
+    return [d["id"] for d in data]
+
+
+class PaginateConcurrentTests(unittest.TestCase):
+    def test_pages_yielded_in_order(self):
+        # later pages finish first
+        ep = FakeEndpoint([{"id": i} for i in range(450)], before_get=lambda skip: time.sleep((500 - skip) / 50000))
+        result = ep.paginate_concurrent(params={"$top": 50}, concurrency=4)
+        pages = list(result.pages)
+
+        self.assertEqual([p.offset for p in pages], list(range(0, 500, 50)))
+        self.assertEqual([p.page_num for p in pages], list(range(10)))
+        self.assertEqual(ids(result.data), list(range(450)))
+
+    def test_same_records_as_serial_paginate(self):
+        ep = FakeEndpoint([{"id": i} for i in range(260)])
+
+        serial = ids(ep.paginate(params={"$top": 50}).data)
+        concurrent = ids(ep.paginate_concurrent(params={"$top": 50}, concurrency=3).data)
+
+        self.assertEqual(serial, concurrent)
+        self.assertEqual(concurrent, list(range(260)))
+
+    def test_stops_after_short_page(self):
+        ep = FakeEndpoint([{"id": i} for i in range(120)])
+        result = ep.paginate_concurrent(params={"$top": 50}, concurrency=2)
+        pages = list(result.pages)
+
+        self.assertEqual([len(p.data) for p in pages], [50, 50, 20])
+        self.assertEqual(ids(result.data), list(range(120)))
+        # at most the in flight window is requested past the short page
+        self.assertLessEqual(max(ep.requested_skips), 100 + 2 * 50)
+
+    def test_requests_past_last_page_are_not_waited_for(self):
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+
+        def before_get(skip: int) -> None:
+            if skip:
+                gate.wait(5)
+
+        ep = FakeEndpoint([{"id": i} for i in range(30)], before_get=before_get)
+        started = time.monotonic()
+        data = ep.paginate_concurrent(params={"$top": 50}, concurrency=3).data
+
+        self.assertEqual(ids(data), list(range(30)))
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertFalse(gate.is_set())
+        # nothing is submitted after the short first page; queued requests that haven't started are cancelled
+        self.assertIn(0, ep.requested_skips)
+        self.assertLessEqual(set(ep.requested_skips), {0, 50, 100})
+
+    def test_worker_thread_errors_propagate(self):
+        def before_get(skip: int) -> None:
+            if skip == 100:
+                raise requests.exceptions.ConnectionError("connection dropped")
+
+        ep = FakeEndpoint([{"id": i} for i in range(500)], before_get=before_get)
+        pages = ep.paginate_concurrent(params={"$top": 50}, concurrency=3).pages
+        received = []
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            for page in pages:
+                received.append(page.offset)
+
+        self.assertEqual(received, [0, 50])
+
+
+class MapConcurrentTests(unittest.TestCase):
+    def test_results_in_item_order(self):
+        ep = FakeEndpoint([])
+
+        def fn(n: int) -> int:
+            time.sleep((10 - n) / 1000)
+            return n * n
+
+        self.assertEqual(ep.map_concurrent(fn, range(10), max_workers=4), [n * n for n in range(10)])
+
+    def test_exceptions_returned_per_item(self):
+        ep = FakeEndpoint([])
+        called = []
+
+        def fn(n: int) -> int:
+            called.append(n)
+
+            if n % 2:
+                raise ValueError(n)
+
+            return n
+
+        with self.assertLogs("tassapi.api.worker", level="ERROR"):
+            results = ep.map_concurrent(fn, range(6), max_workers=3)
+
+        self.assertEqual(sorted(called), list(range(6)))
+        self.assertEqual([r for r in results if not isinstance(r, Exception)], [0, 2, 4])
+        self.assertEqual([r.args[0] for r in results if isinstance(r, ValueError)], [1, 3, 5])
+        self.assertIsInstance(results[1], ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()